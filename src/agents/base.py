@@ -8,18 +8,53 @@ Provides abstract base class with common functionality for all 10 agents:
 - Output parsing
 """
 
+import functools
 import logging
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Optional
 
 from src.utils.config import Config
-from src.utils.llm import LLMInterface, LLMResponse, ModelTier, create_messages, get_llm
+from src.utils.llm import (
+    LLMInterface,
+    LLMResponse,
+    ModelTier,
+    create_messages,
+    get_llm,
+    run_sync,
+)
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def render_shared_context(show_bible: str, creative_prompt: str) -> str:
+    """
+    Render the show bible and creative prompt section once per show.
+
+    Both inputs are fixed for a session, so every agent call reuses the same
+    rendered string instead of re-joining KB-sized text, and the prompt
+    prefix sent to the provider stays byte-identical.
+
+    Args:
+        show_bible: Show bible content.
+        creative_prompt: Creative prompt content.
+
+    Returns:
+        Show bible and creative prompt section text.
+    """
+    return "\n".join(
+        [
+            "### Show Bible",
+            show_bible,
+            "",
+            "### Creative Prompt",
+            creative_prompt,
+        ]
+    )
+
+
 class AgentRole(Enum):
     """Enumeration of all agent roles in the system."""
 
@@ -60,8 +95,22 @@ AGENT_MODEL_TIERS: dict[AgentRole, ModelTier] = {
     AgentRole.QA: ModelTier.SUPPORT,
 }
 
+# Brief role descriptions, built once for get_agent_description()
+_AGENT_DESCRIPTIONS: dict[AgentRole, str] = {
+    AgentRole.SHOWRUNNER: "Final creative authority and decision maker",
+    AgentRole.HEAD_WRITER: "Process manager and creative synthesizer",
+    AgentRole.SENIOR_WRITER_A: "Premise and character specialist",
+    AgentRole.SENIOR_WRITER_B: "Dialogue and punch-up specialist",
+    AgentRole.STAFF_WRITER_A: "High-volume pitch generator",
+    AgentRole.STAFF_WRITER_B: "Structure and callback specialist",
+    AgentRole.STORY_EDITOR: "Continuity and quality control",
+    AgentRole.RESEARCH: "Facts and cultural context",
+    AgentRole.SCRIPT_COORDINATOR: "Formatting and technical standards",
+    AgentRole.QA: "Final validation and quality assurance",
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentContext:
     """Context passed to agents for task execution."""
 
@@ -79,7 +128,7 @@ class AgentContext:
             self.additional_context = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOutput:
     """Structured output from an agent execution."""
 
@@ -239,35 +288,38 @@ class BaseAgent:
 
         return result
 
-    def build_prompt(self, context: AgentContext) -> tuple[str, str]:
+    def build_shared_context(self, context: AgentContext) -> str:
         """
-        Build complete system and user prompts for an LLM call.
+        Build the show context shared by every agent and task in a session.
 
-        Combines the agent's system prompt with task-specific instructions
-        and context.
+        The show bible and creative prompt are identical across all calls,
+        so they are kept apart from the task-specific text and placed first,
+        where providers can cache them as a stable prompt prefix.
 
         Args:
             context: Context for the current task.
 
         Returns:
-            Tuple of (system_prompt, user_prompt).
+            Show bible and creative prompt section text.
+        """
+        return render_shared_context(context.show_bible, context.creative_prompt)
+
+    def build_task_prompt(self, context: AgentContext) -> str:
+        """
+        Build the task-specific part of the user prompt.
+
+        Args:
+            context: Context for the current task.
+
+        Returns:
+            Task header, stage inputs, and task instructions.
         """
-        system_prompt = self.get_system_prompt()
         task_instructions = self.get_task_instructions(context.task_type, context)
 
-        # Build user prompt with all context
-        user_parts = [
-            f"## CURRENT TASK: {context.task_type}",
-            "",
-            "### Show Bible",
-            context.show_bible,
-            "",
-            "### Creative Prompt",
-            context.creative_prompt,
-        ]
+        task_parts = [f"## CURRENT TASK: {context.task_type}"]
 
         if context.previous_output:
-            user_parts.extend(
+            task_parts.extend(
                 [
                     "",
                     "### Previous Stage Output",
@@ -276,7 +328,7 @@ class BaseAgent:
             )
 
         if context.direction_notes:
-            user_parts.extend(
+            task_parts.extend(
                 [
                     "",
                     "### Direction Notes",
@@ -284,7 +336,7 @@ class BaseAgent:
                 ]
             )
 
-        user_parts.extend(
+        task_parts.extend(
             [
                 "",
                 "### Task Instructions",
@@ -292,16 +344,47 @@ class BaseAgent:
             ]
         )
 
-        user_prompt = "\n".join(user_parts)
+        return "\n".join(task_parts)
+
+    def _build_prompt_parts(self, context: AgentContext) -> tuple[str, str, str]:
+        """
+        Build the system prompt, shared show context, and task prompt for a call.
+
+        Args:
+            context: Context for the current task.
+
+        Returns:
+            Tuple of (system_prompt, shared_context, task_prompt).
+        """
+        system_prompt = self.get_system_prompt()
+        shared_context = self.build_shared_context(context)
+        task_prompt = self.build_task_prompt(context)
 
         logger.debug(
-            "Built prompt for %s: system=%d chars, user=%d chars",
+            "Built prompt for %s: system=%d chars, shared=%d chars, task=%d chars",
             self.name,
             len(system_prompt),
-            len(user_prompt),
+            len(shared_context),
+            len(task_prompt),
         )
 
-        return system_prompt, user_prompt
+        return system_prompt, shared_context, task_prompt
+
+    def build_prompt(self, context: AgentContext) -> tuple[str, str]:
+        """
+        Build complete system and user prompts for an LLM call.
+
+        Combines the agent's system prompt with the shared show context
+        and the task-specific instructions.
+
+        Args:
+            context: Context for the current task.
+
+        Returns:
+            Tuple of (system_prompt, user_prompt).
+        """
+        system_prompt, shared_context, task_prompt = self._build_prompt_parts(context)
+        return system_prompt, f"{shared_context}\n\n{task_prompt}"
 
     async def execute(self, context: AgentContext) -> AgentOutput:
         """
@@ -323,11 +406,10 @@ class BaseAgent:
         )
 
         try:
-            # Build prompts
-            system_prompt, user_prompt = self.build_prompt(context)
-
-            # Create messages
-            messages = create_messages(system_prompt, user_prompt)
+            # Build prompts, keeping the shared show context as its own block
+            # so it forms a cacheable prefix
+            system_prompt, shared_context, task_prompt = self._build_prompt_parts(context)
+            messages = create_messages(system_prompt, task_prompt, shared_context=shared_context)
 
             # Make LLM call with tracing metadata
             response = await self.llm.acall(
@@ -394,9 +476,7 @@ class BaseAgent:
         Returns:
             AgentOutput with results and metadata.
         """
-        import asyncio
-
-        return asyncio.run(self.execute(context))
+        return run_sync(self.execute(context))
 
 
 def get_agent_description(role: AgentRole) -> str:
@@ -409,16 +489,4 @@ def get_agent_description(role: AgentRole) -> str:
     Returns:
         Brief description string.
     """
-    descriptions = {
-        AgentRole.SHOWRUNNER: "Final creative authority and decision maker",
-        AgentRole.HEAD_WRITER: "Process manager and creative synthesizer",
-        AgentRole.SENIOR_WRITER_A: "Premise and character specialist",
-        AgentRole.SENIOR_WRITER_B: "Dialogue and punch-up specialist",
-        AgentRole.STAFF_WRITER_A: "High-volume pitch generator",
-        AgentRole.STAFF_WRITER_B: "Structure and callback specialist",
-        AgentRole.STORY_EDITOR: "Continuity and quality control",
-        AgentRole.RESEARCH: "Facts and cultural context",
-        AgentRole.SCRIPT_COORDINATOR: "Formatting and technical standards",
-        AgentRole.QA: "Final validation and quality assurance",
-    }
-    return descriptions.get(role, "Unknown role")
+    return _AGENT_DESCRIPTIONS.get(role, "Unknown role")
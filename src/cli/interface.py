@@ -51,18 +51,23 @@ def display_header(title: str, width: int = 60) -> None:
     if len(padded_title) < width:
         padded_title += " "
 
-    print()
-    print(_color(border, "cyan"))
-    print(_color(padded_title, "bold"))
-    print(_color(border, "cyan"))
-    print()
+    # Emit the block as one write, so a TTY flushes once rather than per line
+    print(
+        "\n".join(
+            [
+                "",
+                _color(border, "cyan"),
+                _color(padded_title, "bold"),
+                _color(border, "cyan"),
+                "",
+            ]
+        )
+    )
 
 
 def display_subheader(title: str) -> None:
     """Display a subheader."""
-    print()
-    print(_color(f"--- {title} ---", "yellow"))
-    print()
+    print(f"\n{_color(f'--- {title} ---', 'yellow')}\n")
 
 
 def display_stage(stage_name: str, stage_number: int, total_stages: int = 6) -> None:
@@ -75,9 +80,9 @@ def display_stage(stage_name: str, stage_number: int, total_stages: int = 6) ->
         total_stages: Total number of stages.
     """
     progress = f"[{stage_number}/{total_stages}]"
-    print()
-    print(_color(f"{progress} ", "dim") + _color(stage_name, "bold"))
-    print(_color("-" * (len(progress) + len(stage_name) + 1), "dim"))
+    title = _color(f"{progress} ", "dim") + _color(stage_name, "bold")
+    rule = _color("-" * (len(progress) + len(stage_name) + 1), "dim")
+    print(f"\n{title}\n{rule}")
 
 
 def display_progress(message: str, current: int, total: int) -> None:
@@ -5,6 +5,7 @@ Loads agent definitions from markdown files with YAML frontmatter,
 parses system prompts and task instructions, and caches results.
 """
 
+import functools
 import logging
 import re
 from pathlib import Path
@@ -23,6 +24,16 @@ from src.config.validation import (
 
 logger = logging.getLogger(__name__)
 
+# Matches "### task_name" headers under "## Task Instructions".
+# Task identifiers are ASCII snake_case, so an explicit ASCII class is used.
+_TASK_SPLIT_RE = re.compile(r"\n###[ \t]+([A-Za-z0-9_]+)[ \t]*\n")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_agent_validator(agents_dir: Path) -> AgentConfigValidator:
+    """Return the shared (stateless) validator for an agents directory."""
+    return AgentConfigValidator(agents_dir)
+
 
 class AgentLoader:
     """Loads and caches agent configurations from markdown files."""
@@ -37,7 +48,7 @@ class AgentLoader:
         """
         self.agents_dir = agents_dir
         self._cache: Dict[AgentRole, AgentDefinition] = {}
-        self.validator = AgentConfigValidator(agents_dir)
+        self.validator = _get_agent_validator(agents_dir)
 
         logger.debug(f"AgentLoader initialized with directory: {agents_dir}")
 
@@ -211,7 +222,7 @@ class AgentLoader:
         task_instructions = {}
 
         # Split by ### headers
-        task_parts = re.split(r'\n###\s+(\w+)\s*\n', task_content)
+        task_parts = _TASK_SPLIT_RE.split(task_content)
 
         # task_parts[0] is content before first ###
         # task_parts[1] is first task name, task_parts[2] is its content
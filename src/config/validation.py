@@ -6,8 +6,9 @@ with clear error messages for non-technical users.
 """
 
 import logging
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -37,7 +38,12 @@ class ConfigurationError(Exception):
         self.message = message
         self.suggestion = suggestion
         self.line_number = line_number
-        super().__init__(self._format_message())
+        # Keep only the short message in args; the multi-line explainer is
+        # built lazily in __str__ so caught-and-rethrown errors stay cheap.
+        super().__init__(message)
+
+    def __str__(self) -> str:
+        return self._format_message()
 
     def _format_message(self) -> str:
         """Format error message for display."""
@@ -210,6 +216,16 @@ class WorkflowConfig(BaseModel):
         default=None, description="Validation rules to enforce"
     )
 
+    @cached_property
+    def stages_by_name(self) -> Dict[str, WorkflowStage]:
+        """Stages indexed by name, built once on first access."""
+        return {stage.name: stage for stage in self.stages}
+
+    @cached_property
+    def sorted_stages(self) -> List[WorkflowStage]:
+        """Stages sorted by ID, built once on first access."""
+        return sorted(self.stages, key=lambda s: s.id)
+
 
 class AgentConfigValidator:
     """Validates agent markdown configuration files."""
@@ -237,8 +253,9 @@ class AgentConfigValidator:
             ConfigurationError: If validation fails
         """
         # Validate all declared tasks have instructions
-        declared_tasks = set(agent_def.metadata.tasks.keys())
-        instruction_tasks = set(agent_def.task_instructions.keys())
+        # Dict key views support set algebra directly, no intermediate sets needed
+        declared_tasks = agent_def.metadata.tasks.keys()
+        instruction_tasks = agent_def.task_instructions.keys()
 
         missing_instructions = declared_tasks - instruction_tasks
         if missing_instructions:
@@ -291,36 +308,55 @@ class WorkflowValidator:
         Raises:
             ConfigurationError: If validation fails
         """
-        # Check all referenced agents exist
+        # Collect every (role, task) reference in one pass, remembering the
+        # first stage that mentions it so errors can point at a location.
+        # Dicts are used as insertion-ordered sets to keep reporting stable.
+        agent_refs: Dict[Tuple[str, str], str] = {}
+        referenced_roles: Dict[str, str] = {}
+        post_processing_refs: Dict[str, str] = {}
         for stage in workflow.stages:
             for agent_ref in stage.agents:
-                if agent_ref.role not in available_agents:
-                    raise ConfigurationError(
-                        file_path=self.workflow_path,
-                        message=f"Stage '{stage.name}' references unknown agent: {agent_ref.role}",
-                        suggestion=f"Create config/agents/{agent_ref.role}.md or use one of: {', '.join(available_agents.keys())}",
-                    )
+                agent_refs.setdefault((agent_ref.role, agent_ref.task), stage.name)
+                referenced_roles.setdefault(agent_ref.role, stage.name)
+            for agent_ref in stage.post_processing or ():
+                post_processing_refs.setdefault(agent_ref.role, stage.name)
 
-                # Check task exists for agent
-                agent = available_agents[agent_ref.role]
-                if agent_ref.task not in agent.metadata.tasks:
-                    available_tasks = list(agent.metadata.tasks.keys())
-                    raise ConfigurationError(
-                        file_path=self.workflow_path,
-                        message=f"Agent '{agent_ref.role}' does not have task '{agent_ref.task}'",
-                        suggestion=f"Use one of the available tasks: {', '.join(available_tasks)}\n"
-                        f"Or add '{agent_ref.task}' to config/agents/{agent_ref.role}.md",
-                    )
+        # Check all referenced agents exist
+        unknown_roles = referenced_roles.keys() - available_agents.keys()
+        if unknown_roles:
+            role = next(r for r in referenced_roles if r in unknown_roles)
+            raise ConfigurationError(
+                file_path=self.workflow_path,
+                message=f"Stage '{referenced_roles[role]}' references unknown agent: {role}",
+                suggestion=f"Create config/agents/{role}.md or use one of: {', '.join(available_agents.keys())}",
+            )
 
-            # Validate post-processing agents
-            if stage.post_processing:
-                for agent_ref in stage.post_processing:
-                    if agent_ref.role not in available_agents:
-                        raise ConfigurationError(
-                            file_path=self.workflow_path,
-                            message=f"Stage '{stage.name}' post-processing references unknown agent: {agent_ref.role}",
-                            suggestion=f"Create config/agents/{agent_ref.role}.md",
-                        )
+        # Check each referenced task exists for its agent
+        provided = {
+            (role, task)
+            for role, agent in available_agents.items()
+            for task in agent.metadata.tasks
+        }
+        unknown_tasks = agent_refs.keys() - provided
+        if unknown_tasks:
+            role, task = next(ref for ref in agent_refs if ref in unknown_tasks)
+            available_tasks = list(available_agents[role].metadata.tasks.keys())
+            raise ConfigurationError(
+                file_path=self.workflow_path,
+                message=f"Agent '{role}' does not have task '{task}'",
+                suggestion=f"Use one of the available tasks: {', '.join(available_tasks)}\n"
+                f"Or add '{task}' to config/agents/{role}.md",
+            )
+
+        # Validate post-processing agents
+        unknown_post_roles = post_processing_refs.keys() - available_agents.keys()
+        if unknown_post_roles:
+            role = next(r for r in post_processing_refs if r in unknown_post_roles)
+            raise ConfigurationError(
+                file_path=self.workflow_path,
+                message=f"Stage '{post_processing_refs[role]}' post-processing references unknown agent: {role}",
+                suggestion=f"Create config/agents/{role}.md",
+            )
 
         # Validate routing rules reference valid stages
         stage_names = {s.name for s in workflow.stages}
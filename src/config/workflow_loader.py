@@ -5,9 +5,11 @@ Loads workflow definitions from YAML files, validates against agent configs,
 and provides query methods for workflow structure.
 """
 
+import functools
 import logging
+import mmap
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
@@ -21,6 +23,16 @@ from src.config.validation import (
 
 logger = logging.getLogger(__name__)
 
+# Workflow files larger than this are parsed straight from a memory map
+# instead of being read into a decoded string first.
+MMAP_THRESHOLD_BYTES = 16 * 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _get_workflow_validator(workflow_path: Path) -> WorkflowValidator:
+    """Return the shared (stateless) validator for a workflow file."""
+    return WorkflowValidator(workflow_path)
+
 
 class WorkflowLoader:
     """Loads and validates workflow configuration from YAML."""
@@ -34,7 +46,7 @@ class WorkflowLoader:
         """
         self.workflow_path = workflow_path
         self.config: Optional[WorkflowConfig] = None
-        self.validator = WorkflowValidator(workflow_path)
+        self.validator = _get_workflow_validator(workflow_path)
 
         logger.debug(f"WorkflowLoader initialized with: {workflow_path}")
 
@@ -62,16 +74,13 @@ class WorkflowLoader:
         logger.debug(f"Loading workflow config from: {self.workflow_path}")
 
         try:
-            content = self.workflow_path.read_text(encoding="utf-8")
-        except Exception as e:
+            yaml_data = self._parse_yaml()
+        except (OSError, UnicodeDecodeError) as e:
             raise ConfigurationError(
                 file_path=self.workflow_path,
                 message=f"Cannot read file: {e}",
                 suggestion="Ensure file exists and is readable",
             )
-
-        try:
-            yaml_data = yaml.safe_load(content)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 file_path=self.workflow_path,
@@ -91,6 +100,29 @@ class WorkflowLoader:
         logger.info(f"Loaded workflow config: {self.config.workflow_name}")
         return self.config
 
+    def _parse_yaml(self) -> Any:
+        """
+        Read and parse the workflow YAML file.
+
+        Large files are handed to the YAML parser as a read-only memory map,
+        avoiding a full copy of the file into a Python string. Small files
+        use a plain read, where mmap setup would cost more than it saves.
+
+        Returns:
+            Parsed YAML document
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the YAML is malformed
+        """
+        if self.workflow_path.stat().st_size <= MMAP_THRESHOLD_BYTES:
+            return yaml.safe_load(self.workflow_path.read_text(encoding="utf-8"))
+
+        logger.debug("Parsing workflow config via mmap: %s", self.workflow_path)
+        with open(self.workflow_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.safe_load(mm)
+
     def validate(self, available_agents: Dict[str, any]) -> None:
         """
         Validate workflow against available agent configurations.
@@ -118,7 +150,7 @@ class WorkflowLoader:
         if self.config is None:
             self.load()
 
-        return sorted(self.config.stages, key=lambda s: s.id)
+        return self.config.sorted_stages
 
     def get_stage(self, stage_name: str) -> Optional[WorkflowStage]:
         """
@@ -133,11 +165,7 @@ class WorkflowLoader:
         if self.config is None:
             self.load()
 
-        for stage in self.config.stages:
-            if stage.name == stage_name:
-                return stage
-
-        return None
+        return self.config.stages_by_name.get(stage_name)
 
     def get_routing_rules(self) -> Dict[str, RoutingRule]:
         """
@@ -8,9 +8,13 @@ Usage:
     python run_sketch.py --debug                # Enable debug logging
     python run_sketch.py --mock-checkpoints     # Auto-approve human checkpoints
     python run_sketch.py --stage pitch_session  # Run single stage only
+    python run_sketch.py --no-cache             # Ignore cached LLM responses
+    python run_sketch.py --speculate            # Draft ahead during beat review
     python run_sketch.py --help                 # Show help
 """
 
+from __future__ import annotations
+
 # === CRITICAL: Initialize tracing BEFORE any LangChain imports ===
 # LangChain checks LANGCHAIN_TRACING_V2 on module import, so we must
 # load environment variables and validate tracing config first.
@@ -30,6 +34,9 @@ def _init_langsmith_tracing() -> None:
             )
             os.environ["LANGCHAIN_TRACING_V2"] = "false"
         else:
+            # Export traces from a background thread instead of blocking each
+            # LLM call on the upload (respect an explicit user setting)
+            os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
             project = os.getenv("LANGCHAIN_PROJECT", "sketch-comedy-agents")
             print(f"LangSmith tracing enabled for project: {project}")
 
@@ -41,16 +48,19 @@ import argparse
 import asyncio
 import logging
 import sys
+import threading
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Coroutine, Iterator, Optional, TypeVar
 
 # Add project root to path so imports work when script is in src/
 _project_root = Path(__file__).parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
-from src.cli.checkpoints import handle_checkpoint, mock_checkpoint
 from src.cli.interface import (
     display_error,
     display_errors,
@@ -63,16 +73,97 @@ from src.cli.interface import (
     display_workflow_complete,
 )
 from src.utils.config import Config, ConfigurationError, load_config
-from src.workflow.graph import compile_app, compile_app_no_interrupts
-from src.workflow.state import SketchState, WorkflowStage, create_initial_state
+
+# The workflow modules pull in LangChain/LangGraph (seconds to import), so
+# they are imported where the workflow runs; --help and --dry-run skip them
+if TYPE_CHECKING:
+    from src.workflow.state import SketchState
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp once and reuses it."""
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        self._last_second = -1
+        self._last_text = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Return the record's timestamp, calling strftime only when the second changes."""
+        second = int(record.created)
+        if second != self._last_second:
+            fmt = datefmt or self.default_time_format
+            self._last_text = time.strftime(fmt, self.converter(second))
+            self._last_second = second
+        return self._last_text
+
+
+# Progress display label and stage number for each graph node
+STAGE_DISPLAY: dict[str, tuple[str, int]] = {
+    "pitch_session": ("Pitch Session", 1),
+    "human_pitch_review": ("Human Pitch Review", 1),
+    "showrunner_select": ("Showrunner Selection", 1),
+    "story_breaking": ("Story Breaking", 2),
+    "human_beat_review": ("Human Beat Review", 2),
+    "drafting": ("Script Drafting", 3),
+    "table_read": ("Table Read", 4),
+    "revision": ("Revision", 5),
+    "polish": ("Polish & Finalize", 6),
+    "human_final_review": ("Final Review", 6),
+}
+TOTAL_STAGES = 6
+
+# Event key LangGraph streams when the graph pauses at an interrupt
+INTERRUPT_EVENT = "__interrupt__"
+
+HUMAN_CHECKPOINT_NODES = frozenset(
+    {"human_pitch_review", "human_beat_review", "human_final_review"}
+)
+
+
+@dataclass(frozen=True)
+class SpeculativeCheckpoint:
+    """
+    Predicted answer for a human checkpoint, used to run ahead with --speculate.
+
+    Attributes:
+        predecessor: Node that runs before the checkpoint; the predicted
+            answer is written to the scratch thread as if from this node,
+            the same way the real answer is applied to the session thread.
+        updates: Checkpoint updates assumed for the speculative run.
+    """
+
+    predecessor: str
+    updates: dict[str, Any] = field(default_factory=dict)
+
+
+# Checkpoints with a predictable common answer, run ahead with --speculate.
+# An approved beat sheet with no notes leads straight through drafting,
+# table read, revision and polish, stopping before the final review.
+SPECULATIVE_CHECKPOINTS: dict[str, SpeculativeCheckpoint] = {
+    "human_beat_review": SpeculativeCheckpoint(
+        predecessor="story_breaking",
+        updates={
+            "human_beat_sheet_approval": True,
+            "human_beat_sheet_notes": "",
+        },
+    ),
+}
+SPECULATION_STOP_NODE = "human_final_review"
+
+# Loggers of the workflow stages, held at WARNING while a speculative run
+# shares the terminal with an interactive checkpoint prompt
+SPECULATION_QUIET_LOGGERS = ("src.workflow", "src.agents", "src.utils")
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -86,6 +177,8 @@ Examples:
     %(prog)s --debug                   Enable debug logging
     %(prog)s --mock-checkpoints        Skip human reviews (for testing)
     %(prog)s --show another_show       Use different show folder
+    %(prog)s --no-cache                Skip cached LLM responses
+    %(prog)s --speculate               Draft ahead during beat sheet review
         """,
     )
 
@@ -130,6 +223,19 @@ Examples:
         help="Run only a specific stage (for testing)",
     )
 
+    parser.add_argument(
+        "--speculate",
+        action="store_true",
+        help="Start drafting while the beat sheet is under review; "
+        "discarded unless approved without notes",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring LLM_CACHE_ENABLED (fresh output)",
+    )
+
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -142,7 +248,12 @@ Examples:
 def setup_logging(debug: bool) -> None:
     """Configure logging based on debug flag."""
     level = logging.DEBUG if debug else logging.INFO
-    logging.getLogger().setLevel(level)
+    root = logging.getLogger()
+    root.setLevel(level)
+
+    formatter = CachedTimeFormatter(LOG_FORMAT, LOG_DATE_FORMAT)
+    for handler in root.handlers:
+        handler.setFormatter(formatter)
 
     # Reduce noise from libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -150,7 +261,13 @@ def setup_logging(debug: bool) -> None:
     logging.getLogger("anthropic").setLevel(logging.WARNING)
 
 
-def save_output(
+async def _write_output_file(path: Path, content: str, description: str) -> None:
+    """Write one output file on a worker thread and log it."""
+    await asyncio.to_thread(path.write_text, content, encoding="utf-8")
+    logger.info("Saved %s to: %s", description, path)
+
+
+async def save_output(
     state: SketchState,
     config: Config,
     session_id: str,
@@ -158,6 +275,9 @@ def save_output(
     """
     Save workflow outputs to files.
 
+    The individual files are written concurrently on worker threads so
+    the event loop is never blocked on disk I/O.
+
     Args:
         state: Final workflow state.
         config: System configuration.
@@ -167,6 +287,7 @@ def save_output(
         Path to main output file.
     """
     output_dir = config.show.output_dir
+    writes = []
 
     # Save final script
     final_script = (
@@ -178,32 +299,223 @@ def save_output(
     script_path = output_dir / "script.txt"
 
     if final_script:
-        script_path.write_text(final_script, encoding="utf-8")
-        logger.info("Saved final script to: %s", script_path)
+        writes.append(_write_output_file(script_path, final_script, "final script"))
 
     # Save beat sheet
     beat_sheet = state.get("beat_sheet", "")
     if beat_sheet:
-        beat_path = output_dir / "beat_sheet.txt"
-        beat_path.write_text(beat_sheet, encoding="utf-8")
-        logger.info("Saved beat sheet to: %s", beat_path)
+        writes.append(_write_output_file(output_dir / "beat_sheet.txt", beat_sheet, "beat sheet"))
 
     # Save QA report
     qa_report = state.get("qa_report", {})
     if qa_report:
-        qa_path = output_dir / "qa_report.txt"
         qa_content = qa_report.get("content", str(qa_report))
-        qa_path.write_text(qa_content, encoding="utf-8")
-        logger.info("Saved QA report to: %s", qa_path)
+        writes.append(_write_output_file(output_dir / "qa_report.txt", qa_content, "QA report"))
+
+    await asyncio.gather(*writes)
 
     return str(script_path)
 
 
+def _apply_stream_event(
+    event: dict[str, Any],
+    current_state: SketchState,
+    mock_checkpoints: bool = False,
+) -> SketchState:
+    """
+    Display progress for one streamed graph event and merge its output.
+
+    Node outputs are applied to current_state in place as patches, rather
+    than copying the whole state (with its multi-KB drafts) per event.
+
+    Args:
+        event: Mapping of node name to node output from app.astream().
+        current_state: State accumulated so far; updated in place.
+        mock_checkpoints: Whether to auto-approve human checkpoint nodes.
+
+    Returns:
+        The same state object, with the event's node outputs merged in.
+    """
+    for node_name, node_output in event.items():
+        if node_name in ("__end__", INTERRUPT_EVENT):
+            continue
+
+        stage_info = STAGE_DISPLAY.get(node_name)
+        if stage_info:
+            display_stage(stage_info[0], stage_info[1], TOTAL_STAGES)
+
+        if isinstance(node_output, dict):
+            current_state.update(node_output)
+
+            if mock_checkpoints and node_name in HUMAN_CHECKPOINT_NODES:
+                from src.cli.checkpoints import mock_checkpoint
+
+                current_state.update(mock_checkpoint(current_state, node_name))
+
+    return current_state
+
+
+async def _stream_until_interrupt(
+    app: Any,
+    graph_input: Optional[SketchState],
+    thread_config: dict[str, Any],
+    current_state: SketchState,
+) -> bool:
+    """
+    Stream the workflow until it pauses or finishes, applying events to current_state.
+
+    The pause is normally reported by an __interrupt__ event. LangGraph
+    releases that do not stream that event for interrupt_before pauses are
+    covered by checking the thread's pending nodes once the stream ends.
+
+    Args:
+        app: Compiled workflow application.
+        graph_input: Initial state, or None to resume from the checkpoint.
+        thread_config: Thread config of the session.
+        current_state: State accumulated so far; updated in place.
+
+    Returns:
+        True if the run stopped at an interrupt, False if the workflow ended.
+    """
+    interrupted = False
+    async for event in app.astream(graph_input, thread_config):
+        _apply_stream_event(event, current_state)
+        interrupted = INTERRUPT_EVENT in event
+    if not interrupted:
+        # No interrupt event: paused only if nodes are still pending
+        interrupted = bool((await app.aget_state(thread_config)).next)
+    return interrupted
+
+
+@contextmanager
+def _quiet_loggers(names: tuple[str, ...], level: int = logging.WARNING) -> Iterator[None]:
+    """
+    Temporarily raise the level of the given loggers, restoring it on exit.
+
+    Args:
+        names: Logger names to quiet.
+        level: Minimum level let through while quieted.
+    """
+    loggers = [logging.getLogger(name) for name in names]
+    previous = [lg.level for lg in loggers]
+    for lg in loggers:
+        lg.setLevel(max(level, lg.getEffectiveLevel()))
+    try:
+        yield
+    finally:
+        for lg, lg_level in zip(loggers, previous):
+            lg.setLevel(lg_level)
+
+
+class _BackgroundRun:
+    """
+    Coroutine driven to completion on its own OS thread and event loop.
+
+    Used for speculative runs so the checkpoint prompt can stay on the main
+    thread: a blocking input() there still receives Ctrl-C, and no executor
+    thread is left waiting on the terminal when the CLI shuts down.
+    """
+
+    def __init__(self, coro: Coroutine[Any, Any, T]) -> None:
+        """
+        Start running coro in the background.
+
+        Must be called from a running event loop, which is notified when
+        the background run finishes.
+
+        Args:
+            coro: Coroutine to run.
+        """
+        self._main_loop = asyncio.get_running_loop()
+        self._done = self._main_loop.create_future()
+        self._loop = asyncio.new_event_loop()
+        self._task = self._loop.create_task(coro)
+        self._thread = threading.Thread(target=self._run, name="speculation", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Drive the task on the background loop, then notify the main loop."""
+        try:
+            # wait() leaves the task's outcome for result() to report
+            self._loop.run_until_complete(asyncio.wait([self._task]))
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self._loop.close()
+            with suppress(RuntimeError):  # main loop already closed
+                self._main_loop.call_soon_threadsafe(self._mark_done)
+
+    def _mark_done(self) -> None:
+        """Resolve the main-loop future once the background thread is done."""
+        if not self._done.done():
+            self._done.set_result(None)
+
+    def _cancel_task(self) -> None:
+        """Request cancellation of the task on its own loop."""
+        with suppress(RuntimeError):  # background loop already closed
+            self._loop.call_soon_threadsafe(self._task.cancel)
+
+    async def result(self) -> T:
+        """
+        Wait for the run to finish and return its result.
+
+        If the waiting task is cancelled, the background run is cancelled too.
+
+        Returns:
+            The coroutine's return value.
+
+        Raises:
+            Exception: Whatever the coroutine raised.
+        """
+        try:
+            await self._done
+        except asyncio.CancelledError:
+            self._cancel_task()
+            raise
+        return self._task.result()
+
+    async def cancel(self) -> None:
+        """Cancel the run and wait until its cleanup has finished."""
+        self._cancel_task()
+        await self._done
+
+
+async def _run_speculation(
+    app: Any,
+    state: SketchState,
+    predicted: SpeculativeCheckpoint,
+    spec_config: dict[str, Any],
+) -> SketchState:
+    """
+    Run the stages after a checkpoint on a scratch thread, assuming its predicted answer.
+
+    The scratch thread shares the checkpointer with the real session but has
+    its own thread ID, so nothing it writes is visible unless the session
+    switches over to it.
+
+    Args:
+        app: Compiled application that interrupts at SPECULATION_STOP_NODE.
+        state: State at the pending checkpoint.
+        predicted: Predicted checkpoint answer assumed for the speculative run.
+        spec_config: Thread config for the scratch thread.
+
+    Returns:
+        State reached when the speculative run stops.
+    """
+    await app.aupdate_state(
+        spec_config, {**state, **predicted.updates}, as_node=predicted.predecessor
+    )
+    async for _ in app.astream(None, spec_config):
+        pass
+    snapshot = await app.aget_state(spec_config)
+    return dict(snapshot.values)
+
+
 async def run_workflow(
     config: Config,
     session_id: str,
     mock_checkpoints: bool = False,
     single_stage: Optional[str] = None,
+    speculate: bool = False,
 ) -> SketchState:
     """
     Run the sketch writing workflow.
@@ -213,10 +525,16 @@ async def run_workflow(
         session_id: Session identifier.
         mock_checkpoints: Whether to auto-approve checkpoints.
         single_stage: If set, run only this stage.
+        speculate: Whether to run ahead of predictable human checkpoints.
 
     Returns:
         Final workflow state.
     """
+    from src.cli.checkpoints import handle_checkpoint
+    from src.utils.llm import get_llm
+    from src.workflow.graph import compile_app, compile_app_no_interrupts
+    from src.workflow.state import create_initial_state
+
     display_header("SKETCH COMEDY WRITING SYSTEM")
     display_info(f"Session: {session_id}")
     display_info(f"Show: {config.show.show_folder}")
@@ -237,24 +555,14 @@ async def run_workflow(
     else:
         app = compile_app()
 
+    # Open provider connections while the first stage builds its prompts
+    prewarm = asyncio.create_task(get_llm(config).prewarm())
+
     # Create thread config for persistence
     thread_config = {"configurable": {"thread_id": session_id}}
 
-    # Track stages for progress display
-    stage_order = [
-        ("pitch_session", "Pitch Session", 1),
-        ("human_pitch_review", "Human Pitch Review", 1),
-        ("showrunner_select", "Showrunner Selection", 1),
-        ("story_breaking", "Story Breaking", 2),
-        ("human_beat_review", "Human Beat Review", 2),
-        ("drafting", "Script Drafting", 3),
-        ("table_read", "Table Read", 4),
-        ("revision", "Revision", 5),
-        ("polish", "Polish & Finalize", 6),
-        ("human_final_review", "Final Review", 6),
-    ]
-
-    current_state = initial_state
+    # Working copy that stream events are applied to in place
+    current_state: SketchState = dict(initial_state)
 
     if mock_checkpoints:
         # Run without interrupts
@@ -263,28 +571,7 @@ async def run_workflow(
 
         # Stream through the workflow
         async for event in app.astream(initial_state, thread_config):
-            # Log progress
-            for node_name, node_output in event.items():
-                if node_name == "__end__":
-                    continue
-
-                # Find stage info
-                stage_info = next((s for s in stage_order if s[0] == node_name), None)
-                if stage_info:
-                    display_stage(stage_info[1], stage_info[2], 6)
-
-                # Update state
-                if isinstance(node_output, dict):
-                    current_state = {**current_state, **node_output}
-
-                    # Mock checkpoints
-                    if node_name in [
-                        "human_pitch_review",
-                        "human_beat_review",
-                        "human_final_review",
-                    ]:
-                        mock_updates = mock_checkpoint(current_state, node_name)
-                        current_state = {**current_state, **mock_updates}
+            current_state = _apply_stream_event(event, current_state, mock_checkpoints=True)
 
         logger.info("Workflow execution complete")
 
@@ -292,59 +579,102 @@ async def run_workflow(
         # Run with interrupts for human checkpoints
         logger.info("Starting workflow with human checkpoints...")
 
-        # Run until first interrupt
-        async for event in app.astream(initial_state, thread_config):
-            for node_name, node_output in event.items():
-                if node_name == "__end__":
-                    continue
-
-                stage_info = next((s for s in stage_order if s[0] == node_name), None)
-                if stage_info:
-                    display_stage(stage_info[1], stage_info[2], 6)
-
-                if isinstance(node_output, dict):
-                    current_state = {**current_state, **node_output}
-
-        # Handle checkpoints
-        while True:
-            # Get current state from checkpointer
-            snapshot = app.get_state(thread_config)
+        # Scratch app for speculative runs, sharing the session's checkpointer
+        spec_app = None
+        if speculate:
+            spec_app = compile_app(
+                checkpointer=app.checkpointer,
+                interrupt_before=[SPECULATION_STOP_NODE],
+            )
 
-            if not snapshot.next:
-                # No more nodes to run
-                break
+        # Run until first interrupt
+        interrupted = await _stream_until_interrupt(
+            app, initial_state, thread_config, current_state
+        )
 
+        # Handle checkpoints; the stream itself reports when the graph pauses
+        while interrupted:
+            # Read the checkpoint once per pause, for the pending node
+            snapshot = await app.aget_state(thread_config)
             next_node = snapshot.next[0]
 
             # Check if this is a human checkpoint
-            if next_node in ["human_pitch_review", "human_beat_review", "human_final_review"]:
-                # Get current state
-                current_state = snapshot.values
-
-                # Handle the checkpoint
-                updates = handle_checkpoint(current_state, next_node)
+            if next_node in HUMAN_CHECKPOINT_NODES:
+                # Get current state (copied: the snapshot belongs to the checkpointer)
+                current_state = dict(snapshot.values)
+
+                predicted = SPECULATIVE_CHECKPOINTS.get(next_node) if spec_app else None
+                if predicted is None:
+                    # Handle the checkpoint
+                    updates = handle_checkpoint(current_state, next_node)
+                else:
+                    # Run ahead on a scratch graph thread, driven from a background
+                    # OS thread, while the human reviews on the main thread
+                    checkpoint_id = snapshot.config["configurable"]["checkpoint_id"]
+                    spec_config = {
+                        "configurable": {"thread_id": f"{session_id}:spec:{checkpoint_id}"}
+                    }
+                    speculation = _BackgroundRun(
+                        _run_speculation(spec_app, current_state, predicted, spec_config)
+                    )
+                    try:
+                        # Keep stage progress logs off the interactive prompt
+                        with _quiet_loggers(SPECULATION_QUIET_LOGGERS):
+                            updates = handle_checkpoint(current_state, next_node)
+                    except BaseException:
+                        # Ctrl-C or EOF at the prompt: stop the run ahead too
+                        await speculation.cancel()
+                        raise
+
+                    if updates == predicted.updates:
+                        try:
+                            spec_state = await speculation.result()
+                        except Exception:
+                            logger.warning(
+                                "Speculative run failed; continuing normally", exc_info=True
+                            )
+                        else:
+                            # Promote: the session continues on the speculative thread
+                            display_info("Using the draft prepared during your review")
+                            current_state = spec_state
+                            thread_config = spec_config
+                            continue
+                    else:
+                        logger.info("Discarding speculative run for %s", next_node)
+                        await speculation.cancel()
 
                 # Update state
-                app.update_state(thread_config, updates)
+                await app.aupdate_state(thread_config, updates)
 
             # Continue execution
-            async for event in app.astream(None, thread_config):
-                for node_name, node_output in event.items():
-                    if node_name == "__end__":
-                        continue
-
-                    stage_info = next((s for s in stage_order if s[0] == node_name), None)
-                    if stage_info:
-                        display_stage(stage_info[1], stage_info[2], 6)
-
-                    if isinstance(node_output, dict):
-                        current_state = {**current_state, **node_output}
+            interrupted = await _stream_until_interrupt(app, None, thread_config, current_state)
 
         logger.info("Workflow complete")
 
+    prewarm.cancel()
     return current_state
 
 
+def _run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on uvloop when installed (the "perf" extra), else on asyncio."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
+def _flush_langsmith_traces() -> None:
+    """Wait for background trace uploads to finish before the process exits."""
+    if os.getenv("LANGCHAIN_TRACING_V2", "").lower() != "true":
+        return
+
+    from langchain_core.tracers.langchain import wait_for_all_tracers
+
+    logger.debug("Flushing pending LangSmith traces...")
+    wait_for_all_tracers()
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -352,6 +682,10 @@ def main() -> int:
     # Setup logging
     setup_logging(args.debug)
 
+    # Workflow nodes load their own config, so disable the cache via the environment
+    if args.no_cache:
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+
     try:
         # Load configuration
         display_info("Loading configuration...")
@@ -370,12 +704,13 @@ def main() -> int:
         session_id = args.session or f"sketch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
         # Run workflow
-        final_state = asyncio.run(
+        final_state = _run_async(
             run_workflow(
                 config=config,
                 session_id=session_id,
                 mock_checkpoints=args.mock_checkpoints,
                 single_stage=args.stage,
+                speculate=args.speculate,
             )
         )
 
@@ -385,7 +720,7 @@ def main() -> int:
             display_errors(errors)
 
         # Save outputs
-        output_path = save_output(final_state, config, session_id)
+        output_path = _run_async(save_output(final_state, config, session_id))
 
         # Display completion
         token_usage = final_state.get("token_usage", {})
@@ -407,6 +742,9 @@ def main() -> int:
         logger.exception("Unexpected error during workflow execution")
         return 1
 
+    finally:
+        _flush_langsmith_traces()
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -5,6 +5,7 @@ Handles loading environment variables, show bible, and creative prompt files.
 Provides validation and sensible defaults.
 """
 
+import functools
 import logging
 import os
 from dataclasses import dataclass, field
@@ -23,7 +24,7 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     """Configuration for LLM providers."""
 
@@ -31,6 +32,8 @@ class LLMConfig:
     api_key: str
     creative_model: str  # Model for creative roles (Sonnet)
     support_model: str  # Model for support roles (Haiku)
+    max_concurrency: int = 8  # Provider requests in flight at once
+    tokens_per_minute: int = 0  # Client-side prompt token budget (0 = unlimited)
 
     def __post_init__(self) -> None:
         """Validate LLM configuration."""
@@ -40,6 +43,10 @@ class LLMConfig:
             raise ConfigurationError("Creative model not specified")
         if not self.support_model:
             raise ConfigurationError("Support model not specified")
+        if self.max_concurrency < 1:
+            raise ConfigurationError("max_concurrency must be at least 1")
+        if self.tokens_per_minute < 0:
+            raise ConfigurationError("tokens_per_minute cannot be negative")
         logger.debug(
             "LLM config validated: provider=%s, creative_model=%s, support_model=%s",
             self.provider,
@@ -48,7 +55,7 @@ class LLMConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """Configuration for workflow behavior."""
 
@@ -68,7 +75,7 @@ class WorkflowConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShowConfig:
     """Configuration for the current show being worked on."""
 
@@ -88,7 +95,7 @@ class ShowConfig:
         logger.debug("Show config loaded: folder=%s", self.show_folder)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Complete configuration for the sketch comedy system."""
 
@@ -101,18 +108,23 @@ class Config:
     # Optional agent loader for markdown-based agent configs
     agent_loader: Optional[any] = None  # Will be src.config.agent_loader.AgentLoader
 
+    # Optional LLM response cache (opt-in via LLM_CACHE_ENABLED)
+    llm_cache: Optional[any] = None  # Will be src.utils.llm_cache.LLMCache
+
     # Optional monitoring configuration
     langsmith_enabled: bool = False
     langsmith_api_key: Optional[str] = None
     langsmith_project: str = "sketch-comedy-agents"
 
 
+@functools.lru_cache(maxsize=1)
 def _get_project_root() -> Path:
     """
     Determine the project root directory.
 
     Walks up from this file's location to find the project root
-    (directory containing pyproject.toml or .env).
+    (directory containing pyproject.toml or .env). The location of this
+    file never changes within a process, so the result is cached.
 
     Returns:
         Path to project root directory.
@@ -143,6 +155,10 @@ def _load_file_content(file_path: Path, description: str) -> str:
     """
     Load content from a file with error handling.
 
+    Contents are cached per file and reused until the file's modification
+    time or size changes, so repeated loads of an unchanged show file skip
+    the disk read.
+
     Args:
         file_path: Path to the file to load.
         description: Human-readable description for error messages.
@@ -162,7 +178,37 @@ def _load_file_content(file_path: Path, description: str) -> str:
         raise ConfigurationError(f"{description} is not a file: {file_path}")
 
     try:
-        content = file_path.read_text(encoding="utf-8")
+        stat = file_path.stat()
+    except OSError as e:
+        raise ConfigurationError(f"Cannot read {description}: {e}") from e
+
+    return _read_file_cached(str(file_path), stat.st_mtime_ns, stat.st_size, description)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_file_cached(path: str, mtime_ns: int, size: int, description: str) -> str:
+    """
+    Read and validate a file's content, memoized on its stat signature.
+
+    Args:
+        path: Path of the file to read.
+        mtime_ns: Modification time, part of the cache key only.
+        size: File size in bytes, part of the cache key only.
+        description: Human-readable description for error messages.
+
+    Returns:
+        Content of the file as a string.
+
+    Raises:
+        ConfigurationError: If file cannot be read or is empty.
+    """
+    file_path = Path(path)
+    try:
+        # One read and one decode; read_text() would go through TextIOWrapper
+        content = file_path.read_bytes().decode("utf-8")
+        if "\r" in content:
+            # Keep read_text()'s universal-newline behavior for Windows-edited files
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
         if not content.strip():
             raise ConfigurationError(f"{description} is empty: {file_path}")
         logger.debug("Loaded %s (%d characters)", description, len(content))
@@ -173,6 +219,26 @@ def _load_file_content(file_path: Path, description: str) -> str:
         raise ConfigurationError(f"Cannot read {description}: {e}") from e
 
 
+def _list_available_shows(shows_dir: Path) -> list[str]:
+    """
+    List show folder names for error messages.
+
+    Uses os.scandir so directory checks come from the directory listing
+    itself rather than a stat() per entry.
+
+    Args:
+        shows_dir: The Shows/ directory.
+
+    Returns:
+        Sorted show folder names, or an empty list if shows_dir is missing.
+    """
+    try:
+        with os.scandir(shows_dir) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    except FileNotFoundError:
+        return []
+
+
 def _detect_llm_provider() -> tuple[str, str, str, str]:
     """
     Detect which LLM provider is configured based on environment variables.
@@ -236,12 +302,13 @@ def load_config(
         >>> print(config.debug)
         True
     """
-    # Configure logging based on debug flag
-    log_level = logging.DEBUG if debug else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    # Configure logging only when the caller (e.g. run_sketch.py) has not
+    # already, so records are never emitted through duplicate handlers
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.DEBUG if debug else logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
 
     logger.info("Loading configuration...")
 
@@ -266,6 +333,8 @@ def load_config(
         api_key=api_key,
         creative_model=creative_model,
         support_model=support_model,
+        max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+        tokens_per_minute=int(os.getenv("LLM_TOKENS_PER_MINUTE", "0")),
     )
 
     # Load workflow configuration
@@ -288,7 +357,7 @@ def load_config(
     shows_dir = project_root / "Shows"
     show_dir = shows_dir / show_folder
     if not show_dir.exists():
-        available = [d.name for d in shows_dir.iterdir() if d.is_dir()]
+        available = _list_available_shows(shows_dir)
         raise ConfigurationError(
             f"Show folder not found: {show_dir}\n"
             f"Available shows: {available if available else 'None'}"
@@ -329,6 +398,15 @@ def load_config(
     else:
         logger.debug("Agent config directory not found: %s (using hardcoded prompts)", agents_dir)
 
+    # Optional response cache for re-running sessions during development.
+    # Off by default: creative calls run at temperature > 0, and replaying
+    # cached output is only wanted when explicitly requested.
+    llm_cache = None
+    if os.getenv("LLM_CACHE_ENABLED", "").lower() == "true":
+        from src.utils.llm_cache import LLMCache
+
+        llm_cache = LLMCache(output_dir / ".cache" / "llm_responses.sqlite3")
+
     # Check for LangSmith monitoring
     langsmith_enabled = os.getenv("LANGCHAIN_TRACING_V2", "").lower() == "true"
     langsmith_key = os.getenv("LANGCHAIN_API_KEY")
@@ -346,6 +424,7 @@ def load_config(
         project_root=project_root,
         debug=debug,
         agent_loader=agent_loader,
+        llm_cache=llm_cache,
         langsmith_enabled=langsmith_enabled,
         langsmith_api_key=langsmith_key,
         langsmith_project=langsmith_project,
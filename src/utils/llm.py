@@ -3,33 +3,191 @@ LLM interface for the sketch comedy writing system.
 
 Provides unified interface to Anthropic and OpenAI providers with:
 - Automatic retry logic with exponential backoff
+- Client-side concurrency and token-rate limiting
 - Token usage tracking
 - Async and sync call support
 - Model tier selection (creative vs support)
 """
 
 import asyncio
+import atexit
+import functools
 import logging
+import threading
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Coroutine, Optional, TypeVar
 
+import anthropic
+import httpx
+import openai
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from tenacity import (
+    RetryCallState,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
 
-from src.utils.config import Config, LLMConfig
+from src.utils.config import Config, LLMConfig, load_config
+from src.utils.llm_cache import LLMCache
+from src.utils.rate_limit import RateLimiter, estimate_tokens
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Background event loop shared by all sync wrappers, created on first use
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_thread: Optional[threading.Thread] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create an event loop, using uvloop when installed (the "perf" extra)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the persistent event loop used to run sync LLM calls.
+
+    Running every call() on one long-lived loop lets the provider SDKs keep
+    their async HTTP connection pools (and TLS sessions) alive between
+    calls, instead of asyncio.run() building and tearing down a loop and
+    its connections each time.
+
+    Returns:
+        Event loop running forever on a daemon thread.
+    """
+    global _sync_loop, _sync_loop_thread
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = _new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="llm-sync-loop", daemon=True)
+            thread.start()
+            atexit.register(loop.call_soon_threadsafe, loop.stop)
+            _sync_loop = loop
+            _sync_loop_thread = thread
+            logger.debug("Started persistent event loop for sync LLM calls")
+    return _sync_loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the persistent sync loop.
+
+    Use this instead of asyncio.run() in sync wrappers: it works from plain
+    sync code and from threads that already run an event loop (e.g.
+    Jupyter), and every call reuses the same loop and its connections.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The coroutine's result.
+
+    Raises:
+        RuntimeError: If called from a coroutine running on the sync loop
+            itself, which would deadlock.
+    """
+    loop = _get_sync_loop()
+    if threading.current_thread() is _sync_loop_thread:
+        coro.close()
+        raise RuntimeError("Cannot block the sync event loop from itself; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+# HTTP statuses worth retrying besides 5xx (mirrors the provider SDKs)
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+MAX_RETRY_WAIT_SECONDS = 60.0
+
+# Exponential backoff with up to a second of jitter, so parallel agents spread out
+_exponential_backoff = wait_exponential(
+    multiplier=1, min=4, max=MAX_RETRY_WAIT_SECONDS
+) + wait_random(0, 1)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Decide whether a failed LLM call is worth retrying.
+
+    Only transient failures qualify: dropped connections, timeouts, rate
+    limits and server-side errors. Bad requests, auth failures and bugs in
+    our own code fail immediately instead of waiting through the backoff.
+
+    Args:
+        exc: Exception raised by the call.
+
+    Returns:
+        True if the call should be retried.
+    """
+    if isinstance(
+        exc, (httpx.TransportError, anthropic.APIConnectionError, openai.APIConnectionError)
+    ):
+        return True
+    if isinstance(exc, (anthropic.APIStatusError, openai.APIStatusError)):
+        return exc.status_code in RETRYABLE_STATUS_CODES or exc.status_code >= 500
+    return False
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """
+    Compute the wait before the next attempt.
+
+    Honors a numeric Retry-After header from the provider when present and
+    otherwise backs off exponentially with jitter.
+
+    Args:
+        retry_state: Tenacity state for the failed attempt.
+
+    Returns:
+        Seconds to wait.
+    """
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_WAIT_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; use the exponential backoff
+    return _exponential_backoff(retry_state)
+
+
+def _retry_llm_call(provider: str) -> Any:
+    """
+    Build the retry decorator for a provider's acall().
+
+    Args:
+        provider: Provider name for log messages.
+
+    Returns:
+        Tenacity retry decorator.
+    """
+    return retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=_wait_for_retry,
+        before_sleep=lambda retry_state: logger.warning(
+            "%s API call failed, retrying (attempt %d)...",
+            provider,
+            retry_state.attempt_number,
+        ),
+    )
+
 
 class ModelTier(Enum):
     """Model tier selection for different agent types."""
@@ -38,16 +196,32 @@ class ModelTier(Enum):
     SUPPORT = "support"  # Junior roles: Haiku/GPT-3.5
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
-    """Tracks token usage across LLM calls."""
+    """
+    Tracks token usage across LLM calls.
+
+    Concurrent acall() coroutines share one instance; add() contains no
+    await, so each update runs to completion on the event loop without a lock.
+    """
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_tokens: int = 0
     call_count: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
 
-    def add(self, prompt_tokens: int, completion_tokens: int, total_tokens: int) -> None:
+    def add(
+        self,
+        prompt_tokens: int,
+        completion_tokens: int,
+        total_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_creation_tokens: int = 0,
+    ) -> None:
         """
         Add token counts from a single LLM call.
 
@@ -55,10 +229,14 @@ class TokenUsage:
             prompt_tokens: Number of input tokens.
             completion_tokens: Number of output tokens.
             total_tokens: Total tokens used.
+            cache_read_tokens: Input tokens served from the provider's prompt cache.
+            cache_creation_tokens: Input tokens written to the provider's prompt cache.
         """
         self.prompt_tokens += prompt_tokens
         self.completion_tokens += completion_tokens
         self.total_tokens += total_tokens
+        self.cache_read_tokens += cache_read_tokens
+        self.cache_creation_tokens += cache_creation_tokens
         self.call_count += 1
         logger.debug(
             "Token usage updated: +%d prompt, +%d completion (total: %d)",
@@ -73,6 +251,10 @@ class TokenUsage:
         self.completion_tokens = 0
         self.total_tokens = 0
         self.call_count = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_read_tokens = 0
+        self.cache_creation_tokens = 0
         logger.debug("Token usage counters reset")
 
     def __str__(self) -> str:
@@ -80,7 +262,9 @@ class TokenUsage:
             f"TokenUsage(calls={self.call_count}, "
             f"prompt={self.prompt_tokens}, "
             f"completion={self.completion_tokens}, "
-            f"total={self.total_tokens})"
+            f"total={self.total_tokens}, "
+            f"cache_hits={self.cache_hits}, "
+            f"cache_read={self.cache_read_tokens})"
         )
 
 
@@ -102,15 +286,25 @@ class LLMResponse:
 class LLMInterface(ABC):
     """Abstract base class for LLM providers."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, cache: Optional[LLMCache] = None) -> None:
         """
         Initialize LLM interface.
 
         Args:
             config: LLM configuration with API keys and model names.
+            cache: Optional response cache. If set, identical requests are
+                answered from the cache instead of the provider.
         """
         self.config = config
+        self.cache = cache
         self.usage = TokenUsage()
+        self._model_names = {
+            ModelTier.CREATIVE: config.creative_model,
+            ModelTier.SUPPORT: config.support_model,
+        }
+        self._rate_limiters: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RateLimiter] = (
+            weakref.WeakKeyDictionary()
+        )
         logger.info("Initialized %s LLM interface", self.__class__.__name__)
 
     @abstractmethod
@@ -170,12 +364,107 @@ class LLMInterface(ABC):
             tags: Optional tags for filtering in LangSmith.
             metadata: Optional key-value metadata for the trace.
 
+        Works from plain sync code and from code already running inside an
+        event loop (e.g. Jupyter): the call is always executed on the shared
+        background loop, never via asyncio.run().
+
         Returns:
             LLMResponse with content and usage metadata.
+
+        Raises:
+            RuntimeError: If called from a coroutine running on the shared
+                background loop itself, which would deadlock.
         """
-        return asyncio.run(
-            self.acall(messages, tier, run_name=run_name, tags=tags, metadata=metadata)
-        )
+        return run_sync(self.acall(messages, tier, run_name=run_name, tags=tags, metadata=metadata))
+
+    async def _invoke_model(
+        self,
+        model: Any,
+        model_name: str,
+        messages: list[BaseMessage],
+        invoke_config: dict[str, Any],
+    ) -> tuple[AIMessage, bool]:
+        """
+        Invoke a LangChain model, consulting the response cache first.
+
+        Cache hits come back as an AIMessage without usage metadata and are
+        flagged, so callers count them in cache_hits only, not as provider
+        calls or tokens. Provider calls are admitted through the
+        rate limiter; cache hits skip it. Cache reads and writes run on a
+        worker thread so SQLite I/O never blocks the event loop.
+
+        Args:
+            model: LangChain chat model instance.
+            model_name: Name of the model, used in the cache key.
+            messages: List of LangChain messages.
+            invoke_config: Tracing config for the call (may be empty).
+
+        Returns:
+            Tuple of (response message, whether it was served from the cache).
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(
+                model_name, getattr(model, "temperature", None), messages
+            )
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit for %s", model_name)
+                self.usage.cache_hits += 1
+                return AIMessage(content=cached), True
+            self.usage.cache_misses += 1
+
+        # Make the call with or without config
+        async with self._rate_limiter().limit(estimate_tokens(messages)):
+            if invoke_config:
+                response = await model.ainvoke(messages, config=invoke_config)
+            else:
+                response = await model.ainvoke(messages)
+
+        if cache_key is not None:
+            await asyncio.to_thread(self.cache.set, cache_key, response.content)
+
+        return response, False
+
+    def _rate_limiter(self) -> RateLimiter:
+        """
+        Get the rate limiter for the running event loop.
+
+        Limiters hold asyncio primitives bound to one loop, and an instance
+        can be used from both the main loop and the sync-call loop, so each
+        loop gets its own limiter built from the config.
+
+        Returns:
+            RateLimiter for the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+        limiter = self._rate_limiters.get(loop)
+        if limiter is None:
+            limiter = self._rate_limiters[loop] = RateLimiter(
+                self.config.max_concurrency, self.config.tokens_per_minute
+            )
+        return limiter
+
+    async def prewarm(self, connections: int = 4) -> None:
+        """
+        Open provider connections ahead of the first real call.
+
+        Sends a few cheap concurrent requests so the TCP and TLS handshakes
+        are done, and the connections sit in the SDK's shared keep-alive
+        pool, before the first agent fan-out. Failures do not stop the
+        workflow, but are logged as warnings so a broken pre-warm is visible.
+
+        Args:
+            connections: Number of concurrent requests (connections) to open.
+        """
+        try:
+            await asyncio.gather(*(self._ping() for _ in range(connections)))
+            logger.debug("Pre-warmed %d provider connections", connections)
+        except Exception as e:
+            logger.warning("Connection pre-warm failed (continuing without it): %s", e)
+
+    async def _ping(self) -> None:
+        """Make one inexpensive request to the provider. No-op by default."""
 
     def get_usage(self) -> TokenUsage:
         """Get current token usage statistics."""
@@ -186,17 +475,105 @@ class LLMInterface(ABC):
         self.usage.reset()
 
 
+def _build_invoke_config(
+    tier: ModelTier,
+    model_name: str,
+    run_name: Optional[str],
+    tags: Optional[list[str]],
+    metadata: Optional[dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Build the LangSmith tracing config for a call.
+
+    Args:
+        tier: Model tier used for the call.
+        model_name: Name of the model used for the call.
+        run_name: Optional name for this run in LangSmith tracing.
+        tags: Optional tags for filtering in LangSmith.
+        metadata: Optional key-value metadata for the trace.
+
+    Returns:
+        Config with model info added to the metadata, or an empty dict when
+        no tracing arguments were given (no allocations on that path).
+    """
+    if not (run_name or tags or metadata):
+        return {}
+
+    invoke_config: dict[str, Any] = {
+        "metadata": {**(metadata or {}), "model_tier": tier.value, "model_name": model_name}
+    }
+    if run_name:
+        invoke_config["run_name"] = run_name
+    if tags:
+        invoke_config["tags"] = tags
+    return invoke_config
+
+
+# Anthropic prompt-cache breakpoint marker (5 minute TTL)
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+@functools.lru_cache(maxsize=32)
+def _cache_marked_system_message(system_prompt: str) -> SystemMessage:
+    """Build the cache-marked form of a system prompt, once per distinct prompt."""
+    return SystemMessage(
+        content=[
+            {
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": EPHEMERAL_CACHE_CONTROL,
+            }
+        ]
+    )
+
+
+def _with_cache_breakpoints(messages: list[BaseMessage]) -> list[BaseMessage]:
+    """
+    Mark stable prompt prefixes for Anthropic prompt caching.
+
+    Adds a cache breakpoint after the system prompt and after the first
+    text block of a block-structured user message (the shared show context
+    from create_messages). Returns new message objects; the inputs are not
+    modified.
+
+    Args:
+        messages: List of LangChain messages.
+
+    Returns:
+        Messages with cache_control set on the stable prefix blocks.
+    """
+    marked: list[BaseMessage] = []
+    user_prefix_marked = False
+    for message in messages:
+        if isinstance(message, SystemMessage) and isinstance(message.content, str):
+            message = _cache_marked_system_message(message.content)
+        elif (
+            isinstance(message, HumanMessage)
+            and isinstance(message.content, list)
+            and len(message.content) > 1
+            and not user_prefix_marked
+        ):
+            first, *rest = message.content
+            message = HumanMessage(
+                content=[{**first, "cache_control": EPHEMERAL_CACHE_CONTROL}, *rest]
+            )
+            user_prefix_marked = True
+        marked.append(message)
+    return marked
+
+
 class AnthropicLLM(LLMInterface):
     """Anthropic Claude LLM interface."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, cache: Optional[LLMCache] = None) -> None:
         """
         Initialize Anthropic LLM interface.
 
         Args:
             config: LLM configuration with Anthropic API key.
+            cache: Optional response cache.
         """
-        super().__init__(config)
+        super().__init__(config, cache)
 
         # Initialize models for each tier
         self._creative_model = ChatAnthropic(
@@ -212,6 +589,11 @@ class AnthropicLLM(LLMInterface):
             temperature=0.3,  # More deterministic for support roles
         )
 
+        self._models = {
+            ModelTier.CREATIVE: self._creative_model,
+            ModelTier.SUPPORT: self._support_model,
+        }
+
         logger.info(
             "Anthropic models initialized: creative=%s, support=%s",
             config.creative_model,
@@ -220,19 +602,16 @@ class AnthropicLLM(LLMInterface):
 
     def get_model(self, tier: ModelTier) -> ChatAnthropic:
         """Get Anthropic model for specified tier."""
-        if tier == ModelTier.CREATIVE:
-            return self._creative_model
-        return self._support_model
+        return self._models[tier]
 
-    @retry(
-        retry=retry_if_exception_type((Exception,)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        before_sleep=lambda retry_state: logger.warning(
-            "Anthropic API call failed, retrying (attempt %d)...",
-            retry_state.attempt_number,
-        ),
-    )
+    async def _ping(self) -> None:
+        """List one model; free, and goes through the same HTTP pool as messages."""
+        # ChatAnthropic has no public async client; a standalone client would
+        # warm its own pool instead of the one messages use. If this private
+        # attribute changes, prewarm() reports it as a warning.
+        await self._creative_model._async_client.models.list(limit=1)
+
+    @_retry_llm_call("Anthropic")
     async def acall(
         self,
         messages: list[BaseMessage],
@@ -256,33 +635,17 @@ class AnthropicLLM(LLMInterface):
             LLMResponse with content and usage metadata.
         """
         model = self.get_model(tier)
-        model_name = (
-            self.config.creative_model if tier == ModelTier.CREATIVE else self.config.support_model
-        )
+        model_name = self._model_names[tier]
 
         logger.debug("Calling Anthropic %s with %d messages", model_name, len(messages))
 
+        # Let the system prompt and shared show context be served from cache
+        messages = _with_cache_breakpoints(messages)
+
         # Build config for LangSmith tracing
-        invoke_config: dict[str, Any] = {}
-        if run_name:
-            invoke_config["run_name"] = run_name
-        if tags:
-            invoke_config["tags"] = tags
-        if metadata:
-            invoke_config["metadata"] = metadata
-
-        # Add model info to metadata for tracing
-        if invoke_config:
-            if "metadata" not in invoke_config:
-                invoke_config["metadata"] = {}
-            invoke_config["metadata"]["model_tier"] = tier.value
-            invoke_config["metadata"]["model_name"] = model_name
+        invoke_config = _build_invoke_config(tier, model_name, run_name, tags, metadata)
 
-        # Make the call with or without config
-        if invoke_config:
-            response = await model.ainvoke(messages, config=invoke_config)
-        else:
-            response = await model.ainvoke(messages)
+        response, from_cache = await self._invoke_model(model, model_name, messages, invoke_config)
 
         # Extract token usage from response metadata
         usage_metadata = getattr(response, "usage_metadata", {}) or {}
@@ -290,8 +653,17 @@ class AnthropicLLM(LLMInterface):
         completion_tokens = usage_metadata.get("output_tokens", 0)
         total_tokens = prompt_tokens + completion_tokens
 
-        # Update usage tracking
-        self.usage.add(prompt_tokens, completion_tokens, total_tokens)
+        # Update usage tracking, including prompt-cache reads and writes;
+        # response-cache hits are not provider calls
+        if not from_cache:
+            token_details = usage_metadata.get("input_token_details", {}) or {}
+            self.usage.add(
+                prompt_tokens,
+                completion_tokens,
+                total_tokens,
+                cache_read_tokens=token_details.get("cache_read", 0) or 0,
+                cache_creation_tokens=token_details.get("cache_creation", 0) or 0,
+            )
 
         logger.debug(
             "Anthropic response: %d chars, %d tokens",
@@ -312,14 +684,15 @@ class AnthropicLLM(LLMInterface):
 class OpenAILLM(LLMInterface):
     """OpenAI GPT LLM interface."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, cache: Optional[LLMCache] = None) -> None:
         """
         Initialize OpenAI LLM interface.
 
         Args:
             config: LLM configuration with OpenAI API key.
+            cache: Optional response cache.
         """
-        super().__init__(config)
+        super().__init__(config, cache)
 
         # Initialize models for each tier
         self._creative_model = ChatOpenAI(
@@ -335,6 +708,11 @@ class OpenAILLM(LLMInterface):
             temperature=0.3,
         )
 
+        self._models = {
+            ModelTier.CREATIVE: self._creative_model,
+            ModelTier.SUPPORT: self._support_model,
+        }
+
         logger.info(
             "OpenAI models initialized: creative=%s, support=%s",
             config.creative_model,
@@ -343,19 +721,13 @@ class OpenAILLM(LLMInterface):
 
     def get_model(self, tier: ModelTier) -> ChatOpenAI:
         """Get OpenAI model for specified tier."""
-        if tier == ModelTier.CREATIVE:
-            return self._creative_model
-        return self._support_model
+        return self._models[tier]
 
-    @retry(
-        retry=retry_if_exception_type((Exception,)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        before_sleep=lambda retry_state: logger.warning(
-            "OpenAI API call failed, retrying (attempt %d)...",
-            retry_state.attempt_number,
-        ),
-    )
+    async def _ping(self) -> None:
+        """List models; free, and goes through the same HTTP pool as completions."""
+        await self._creative_model.root_async_client.models.list()
+
+    @_retry_llm_call("OpenAI")
     async def acall(
         self,
         messages: list[BaseMessage],
@@ -379,33 +751,14 @@ class OpenAILLM(LLMInterface):
             LLMResponse with content and usage metadata.
         """
         model = self.get_model(tier)
-        model_name = (
-            self.config.creative_model if tier == ModelTier.CREATIVE else self.config.support_model
-        )
+        model_name = self._model_names[tier]
 
         logger.debug("Calling OpenAI %s with %d messages", model_name, len(messages))
 
         # Build config for LangSmith tracing
-        invoke_config: dict[str, Any] = {}
-        if run_name:
-            invoke_config["run_name"] = run_name
-        if tags:
-            invoke_config["tags"] = tags
-        if metadata:
-            invoke_config["metadata"] = metadata
-
-        # Add model info to metadata for tracing
-        if invoke_config:
-            if "metadata" not in invoke_config:
-                invoke_config["metadata"] = {}
-            invoke_config["metadata"]["model_tier"] = tier.value
-            invoke_config["metadata"]["model_name"] = model_name
+        invoke_config = _build_invoke_config(tier, model_name, run_name, tags, metadata)
 
-        # Make the call with or without config
-        if invoke_config:
-            response = await model.ainvoke(messages, config=invoke_config)
-        else:
-            response = await model.ainvoke(messages)
+        response, from_cache = await self._invoke_model(model, model_name, messages, invoke_config)
 
         # Extract token usage from response metadata
         usage_metadata = getattr(response, "usage_metadata", {}) or {}
@@ -413,8 +766,17 @@ class OpenAILLM(LLMInterface):
         completion_tokens = usage_metadata.get("output_tokens", 0)
         total_tokens = usage_metadata.get("total_tokens", prompt_tokens + completion_tokens)
 
-        # Update usage tracking
-        self.usage.add(prompt_tokens, completion_tokens, total_tokens)
+        # Update usage tracking, including prompt-cache reads and writes;
+        # response-cache hits are not provider calls
+        if not from_cache:
+            token_details = usage_metadata.get("input_token_details", {}) or {}
+            self.usage.add(
+                prompt_tokens,
+                completion_tokens,
+                total_tokens,
+                cache_read_tokens=token_details.get("cache_read", 0) or 0,
+                cache_creation_tokens=token_details.get("cache_creation", 0) or 0,
+            )
 
         logger.debug(
             "OpenAI response: %d chars, %d tokens",
@@ -432,12 +794,24 @@ class OpenAILLM(LLMInterface):
         )
 
 
+# Interface class for each supported provider
+PROVIDERS: dict[str, type[LLMInterface]] = {
+    "anthropic": AnthropicLLM,
+    "openai": OpenAILLM,
+}
+
+# One interface per distinct LLM configuration and cache file, shared by all nodes
+_llm_instances: dict[tuple[LLMConfig, Optional[Path]], LLMInterface] = {}
+
+
 def get_llm(config: Optional[Config] = None) -> LLMInterface:
     """
     Get LLM interface based on configuration.
 
     This is the primary factory function for obtaining an LLM interface.
     It automatically selects the appropriate provider based on configuration.
+    Interfaces are reused for identical configurations, so every workflow
+    node shares the same chat models and token counters.
 
     Args:
         config: Optional Config object. If None, loads default configuration.
@@ -454,26 +828,38 @@ def get_llm(config: Optional[Config] = None) -> LLMInterface:
         >>> print(response.content)
     """
     if config is None:
-        from src.utils.config import load_config
-
         config = load_config()
 
     llm_config = config.llm
+    cache_path = config.llm_cache.path if config.llm_cache is not None else None
+    key = (llm_config, cache_path)
 
-    if llm_config.provider == "anthropic":
-        logger.info("Creating Anthropic LLM interface")
-        return AnthropicLLM(llm_config)
-    elif llm_config.provider == "openai":
-        logger.info("Creating OpenAI LLM interface")
-        return OpenAILLM(llm_config)
-    else:
-        raise ValueError(f"Unsupported LLM provider: {llm_config.provider}")
+    llm = _llm_instances.get(key)
+    if llm is None:
+        llm_class = PROVIDERS.get(llm_config.provider)
+        if llm_class is None:
+            raise ValueError(f"Unsupported LLM provider: {llm_config.provider}")
+        logger.info("Creating %s LLM interface", llm_config.provider)
+        llm = _llm_instances[key] = llm_class(llm_config, cache=config.llm_cache)
+    return llm
+
+
+@functools.lru_cache(maxsize=32)
+def _system_message(system_prompt: str) -> SystemMessage:
+    """
+    Build the SystemMessage for a system prompt, once per distinct prompt.
+
+    Each agent's system prompt is fixed for the session, so all of its calls
+    share one message object (and byte-identical prompt prefix).
+    """
+    return SystemMessage(content=system_prompt)
 
 
 def create_messages(
     system_prompt: str,
     user_prompt: str,
     conversation_history: Optional[list[dict[str, str]]] = None,
+    shared_context: Optional[str] = None,
 ) -> list[BaseMessage]:
     """
     Create a list of LangChain messages from prompts.
@@ -485,6 +871,10 @@ def create_messages(
         user_prompt: User message content (current task).
         conversation_history: Optional list of previous messages as dicts
             with "role" and "content" keys.
+        shared_context: Optional context reused verbatim across calls (show
+            bible, creative prompt). When given, the user message is split
+            into two text blocks with this one first, so providers can cache
+            it as a prompt prefix.
 
     Returns:
         List of LangChain BaseMessage objects.
@@ -497,7 +887,7 @@ def create_messages(
         >>> len(messages)
         2
     """
-    messages: list[BaseMessage] = [SystemMessage(content=system_prompt)]
+    messages: list[BaseMessage] = [_system_message(system_prompt)]
 
     # Add conversation history if provided
     if conversation_history:
@@ -510,7 +900,17 @@ def create_messages(
                 messages.append(AIMessage(content=content))
 
     # Add current user prompt
-    messages.append(HumanMessage(content=user_prompt))
+    if shared_context:
+        messages.append(
+            HumanMessage(
+                content=[
+                    {"type": "text", "text": shared_context},
+                    {"type": "text", "text": user_prompt},
+                ]
+            )
+        )
+    else:
+        messages.append(HumanMessage(content=user_prompt))
 
     logger.debug("Created %d messages for LLM call", len(messages))
     return messages
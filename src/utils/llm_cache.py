@@ -0,0 +1,120 @@
+"""
+Persistent LLM response cache for the sketch comedy writing system.
+
+Stores provider responses in a small SQLite database keyed on the exact
+request (model, temperature, messages), so re-running a session with
+unchanged inputs can skip paid API calls during development.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from langchain_core.messages import BaseMessage
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """
+    SQLite-backed exact-match cache for LLM responses.
+
+    Each entry maps a SHA-256 request key to the JSON-encoded response
+    content. A new connection is opened per operation so the cache is safe
+    to share between event loops and threads.
+
+    Attributes:
+        path: Location of the SQLite database file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Initialize the cache, creating the database if needed.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, content TEXT NOT NULL)"
+            )
+        logger.info("LLM response cache enabled at: %s", path)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit on success, and always close it."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: Optional[float],
+        messages: list[BaseMessage],
+    ) -> str:
+        """
+        Build a deterministic cache key for an LLM request.
+
+        Args:
+            model: Model name the request is sent to.
+            temperature: Sampling temperature of the model.
+            messages: Messages in the request.
+
+        Returns:
+            Hex SHA-256 digest identifying the request.
+        """
+        payload = {
+            "model": model,
+            "temperature": temperature,
+            "messages": [{"type": m.type, "content": m.content} for m in messages],
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key().
+
+        Returns:
+            Cached response content, or None on a miss.
+        """
+        with self._connect() as conn:
+            row = conn.execute("SELECT content FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, content: Any) -> None:
+        """
+        Store a response in the cache.
+
+        Args:
+            key: Cache key from make_key().
+            content: Response content (string or list of content blocks).
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, content) VALUES (?, ?)",
+                (key, json.dumps(content, ensure_ascii=False)),
+            )
+        logger.debug("Cached LLM response under key %s", key[:12])
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+        logger.info("LLM response cache cleared")
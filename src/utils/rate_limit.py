@@ -0,0 +1,104 @@
+"""
+Client-side rate limiting for LLM calls in the sketch comedy writing system.
+
+The workflow fans out several agent calls at once. Admitting them through a
+concurrency cap and a tokens-per-minute bucket keeps bursts under provider
+limits up front, instead of provoking 429s and waiting out retry backoff.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from langchain_core.messages import BaseMessage
+
+# Configure module logger
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English prose
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+    """
+    Estimate the prompt token count of a request without a tokenizer.
+
+    Args:
+        messages: Messages in the request.
+
+    Returns:
+        Approximate number of prompt tokens.
+    """
+    return sum(len(str(m.content)) for m in messages) // CHARS_PER_TOKEN
+
+
+class RateLimiter:
+    """
+    Concurrency cap plus token-bucket throttle for one event loop.
+
+    The bucket holds up to tokens_per_minute tokens and refills continuously.
+    A request waits until the bucket can cover its estimated tokens; requests
+    larger than the whole bucket wait for a full bucket rather than forever.
+
+    The asyncio primitives bind to the loop they are first used on, so an
+    instance must not be shared between event loops.
+
+    Attributes:
+        max_concurrency: Maximum number of requests in flight.
+        tokens_per_minute: Token budget per minute (0 disables the bucket).
+    """
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: int = 0) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight.
+            tokens_per_minute: Token budget per minute (0 disables the bucket).
+        """
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._bucket_lock = asyncio.Lock()
+        self._tokens = float(tokens_per_minute)
+        self._updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update, up to capacity."""
+        now = time.monotonic()
+        rate = self.tokens_per_minute / 60.0
+        self._tokens = min(self.tokens_per_minute, self._tokens + (now - self._updated_at) * rate)
+        self._updated_at = now
+
+    async def _take_tokens(self, tokens: int) -> None:
+        """
+        Wait until the bucket covers the request, then debit it.
+
+        Args:
+            tokens: Estimated tokens for the request.
+        """
+        if not self.tokens_per_minute:
+            return
+        needed = min(tokens, self.tokens_per_minute)
+        async with self._bucket_lock:
+            self._refill()
+            while self._tokens < needed:
+                delay = (needed - self._tokens) / (self.tokens_per_minute / 60.0)
+                logger.debug("Rate limiter waiting %.1fs for %d tokens", delay, needed)
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= needed
+
+    @asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """
+        Admit one request, holding a concurrency slot for its duration.
+
+        Args:
+            tokens: Estimated tokens for the request.
+        """
+        async with self._semaphore:
+            await self._take_tokens(tokens)
+            yield
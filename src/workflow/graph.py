@@ -5,6 +5,7 @@ Builds and compiles the complete 6-stage workflow graph with all nodes,
 edges, and conditional routing.
 """
 
+import functools
 import logging
 from typing import Optional
 
@@ -33,6 +34,7 @@ from src.workflow.state import SketchState
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def build_workflow_graph() -> StateGraph:
     """
     Build the complete workflow graph for sketch comedy writing.
@@ -52,6 +54,10 @@ def build_workflow_graph() -> StateGraph:
     - After story breaking (approve beat sheet)
     - After polish (approve final script)
 
+    The graph is built once per process and shared by every compile and
+    visualization call; compiling does not modify it, and callers must not
+    add nodes or edges to the returned instance.
+
     Returns:
         Configured StateGraph ready for compilation.
     """
@@ -237,34 +243,18 @@ def get_graph_visualization():
     """
     workflow = build_workflow_graph()
 
-    nodes = [
-        "pitch_session",
-        "human_pitch_review",
-        "showrunner_select",
-        "story_breaking",
-        "human_beat_review",
-        "drafting",
-        "table_read",
-        "revision",
-        "polish",
-        "human_final_review",
-    ]
-
-    edges = [
-        ("pitch_session", "human_pitch_review"),
-        ("human_pitch_review", "showrunner_select"),
-        ("showrunner_select", "story_breaking"),
-        ("story_breaking", "human_beat_review"),
-        ("human_beat_review", "drafting [if approved]"),
-        ("human_beat_review", "story_breaking [if needs revision]"),
-        ("drafting", "table_read"),
-        ("table_read", "revision"),
-        ("revision", "polish [if approved/max]"),
-        ("revision", "table_read [if needs more]"),
-        ("polish", "human_final_review"),
-        ("human_final_review", "END [if approved]"),
-        ("human_final_review", "revision [if needs revision]"),
-    ]
+    # Read nodes and edges from the built graph so the text never drifts
+    nodes = list(workflow.nodes)
+    edges = []
+    for node in nodes:
+        edges.extend(sorted(edge for edge in workflow.edges if edge[0] == node))
+        for branch in workflow.branches.get(node, {}).values():
+            conditions_by_target: dict[str, list[str]] = {}
+            for condition, target in branch.ends.items():
+                conditions_by_target.setdefault(target, []).append(str(condition))
+            for target, conditions in conditions_by_target.items():
+                label = "END" if target == END else target
+                edges.append((node, f"{label} [if {'/'.join(conditions)}]"))
 
     viz = ["WORKFLOW GRAPH", "=" * 50, ""]
     viz.append("NODES:")
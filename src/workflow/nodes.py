@@ -6,12 +6,14 @@ Nodes implement the 6-stage workflow plus human checkpoints.
 """
 
 import asyncio
+import functools
 import logging
 import uuid
-from typing import Any
+from typing import Any, Callable, Coroutine, TypeVar
 
 from src.agents import (
     AgentContext,
+    BaseAgent,
     HeadWriterAgent,
     QAAgent,
     ResearchAgent,
@@ -24,7 +26,7 @@ from src.agents import (
     StoryEditorAgent,
 )
 from src.utils.config import Config, load_config
-from src.utils.llm import LLMInterface, get_llm
+from src.utils.llm import LLMInterface, get_llm, run_sync
 from src.workflow.state import (
     SketchState,
     WorkflowStage,
@@ -35,19 +37,104 @@ from src.workflow.state import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def _get_config_and_llm(state: SketchState) -> tuple[Config, LLMInterface]:
+# Eager task starts are available from Python 3.12
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_and_llm() -> tuple[Config, LLMInterface]:
     """
-    Get or create config and LLM interface.
+    Load config and create the LLM interface once per process.
 
-    Note: In production, these would be injected or cached.
-    For now, we load fresh each time.
+    Loading is deferred to the first node call so that CLI overrides
+    (e.g. --no-cache) are already applied to the environment.
     """
     config = load_config()
     llm = get_llm(config)
     return config, llm
 
 
+def _get_config_and_llm(state: SketchState) -> tuple[Config, LLMInterface]:
+    """
+    Get the shared config and LLM interface.
+
+    Every node reuses the same instances instead of re-reading the show
+    files and rebuilding the provider client per stage.
+    """
+    return _load_config_and_llm()
+
+
+@functools.lru_cache(maxsize=32)
+def _agent(agent_cls: type[BaseAgent], config: Config, llm: LLMInterface) -> BaseAgent:
+    """
+    Get a shared agent instance for the given config and LLM interface.
+
+    Agents keep no per-call state, so each role is constructed once and
+    reused by every node instead of being rebuilt per stage.
+
+    Args:
+        agent_cls: Agent class to instantiate.
+        config: Application configuration.
+        llm: LLM interface the agent calls.
+
+    Returns:
+        The cached agent instance.
+    """
+    return agent_cls(config, llm)
+
+
+def _start(coro: Coroutine[Any, Any, T]) -> "asyncio.Future[T]":
+    """
+    Schedule an agent call as a task, starting it eagerly where supported.
+
+    On Python 3.12+ the task runs synchronously up to its first real await
+    (prompt building, cache lookups) instead of waiting a loop iteration.
+
+    Args:
+        coro: Coroutine to run.
+
+    Returns:
+        The scheduled task.
+    """
+    if _eager_task_factory is not None:
+        return _eager_task_factory(asyncio.get_running_loop(), coro)
+    return asyncio.ensure_future(coro)
+
+
+async def _gather_agents(*coros: Coroutine[Any, Any, Any]) -> list[Any]:
+    """
+    Run agent calls concurrently, collecting exceptions as results.
+
+    Args:
+        *coros: Agent coroutines to run.
+
+    Returns:
+        Results in argument order; failed calls yield their exception.
+    """
+    return await asyncio.gather(*(_start(c) for c in coros), return_exceptions=True)
+
+
+def _format_contributions(items: list[dict[str, Any]], with_focus: bool = False) -> str:
+    """
+    Format agent contributions as blocks headed "=== Agent ===".
+
+    Args:
+        items: Contributions with "agent" and "content" keys (and
+            "focus_area" when with_focus is set).
+        with_focus: Include each contribution's focus area in its header.
+
+    Returns:
+        Newline-joined contribution blocks.
+    """
+    if with_focus:
+        return "\n".join(
+            [f"=== {i['agent']} ({i['focus_area']}) ===\n{i['content']}" for i in items]
+        )
+    return "\n".join([f"=== {i['agent']} ===\n{i['content']}" for i in items])
+
+
 def _update_tokens_from_output(state: SketchState, output: Any) -> SketchState:
     """Update token usage from agent output if available."""
     if hasattr(output, "token_usage") and output.token_usage:
@@ -74,7 +161,7 @@ async def pitch_session_node(state: SketchState) -> SketchState:
     - Senior Writer A: 2 pitches (premise/character)
     - Senior Writer B: 2 pitches (dialogue-driven)
 
-    Then Research Agent validates and Head Writer compiles.
+    Then Research Agent validates while Head Writer compiles.
     """
     logger.info("=== STAGE 1: PITCH SESSION ===")
     state = update_stage(state, WorkflowStage.PITCH_SESSION)
@@ -90,19 +177,18 @@ async def pitch_session_node(state: SketchState) -> SketchState:
     )
 
     # Initialize agents
-    staff_a = StaffWriterA(config, llm)
-    staff_b = StaffWriterB(config, llm)
-    senior_a = SeniorWriterA(config, llm)
-    senior_b = SeniorWriterB(config, llm)
+    staff_a = _agent(StaffWriterA, config, llm)
+    staff_b = _agent(StaffWriterB, config, llm)
+    senior_a = _agent(SeniorWriterA, config, llm)
+    senior_b = _agent(SeniorWriterB, config, llm)
 
     # Execute pitch generation in parallel
     logger.info("Generating pitches from 4 agents in parallel...")
-    results = await asyncio.gather(
+    results = await _gather_agents(
         staff_a.execute(context),
         staff_b.execute(context),
         senior_a.execute(context),
         senior_b.execute(context),
-        return_exceptions=True,
     )
 
     # Collect pitches
@@ -132,18 +218,36 @@ async def pitch_session_node(state: SketchState) -> SketchState:
 
     state["pitches"] = all_pitches
 
-    # Research Agent validates pitches
-    logger.info("Research Agent validating pitches...")
-    research = ResearchAgent(config, llm)
+    # Research Agent validates pitches while Head Writer compiles them.
+    # The compile prompt is built from the pitches alone, so both run together.
+    logger.info("Research Agent validating and Head Writer compiling pitches...")
+    # One "---"-separated listing serves both agents
+    pitches_text = "\n\n---\n\n".join([p["content"] for p in all_pitches])
+    research = _agent(ResearchAgent, config, llm)
     research_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
         task_type="validate_pitches",
         session_id=state.get("session_id"),
-        previous_output="\n\n".join([p["content"] for p in all_pitches]),
+        previous_output=pitches_text,
     )
-    research_result = await research.execute(research_context)
-    if research_result.success:
+    head_writer = _agent(HeadWriterAgent, config, llm)
+    compile_context = AgentContext(
+        show_bible=state["show_bible"],
+        creative_prompt=state["creative_prompt"],
+        task_type="compile_pitches",
+        session_id=state.get("session_id"),
+        previous_output=pitches_text,
+    )
+    research_result, compile_result = await _gather_agents(
+        research.execute(research_context),
+        head_writer.execute(compile_context),
+    )
+
+    if isinstance(research_result, Exception):
+        logger.error("Research Agent failed: %s", research_result)
+        state = add_error(state, str(research_result), "pitch_session:research")
+    elif research_result.success:
         state["research_notes_pitches"] = {"content": research_result.content}
         state = _update_tokens_from_output(state, research_result)
     else:
@@ -151,19 +255,10 @@ async def pitch_session_node(state: SketchState) -> SketchState:
             state, research_result.error_message or "Research failed", "pitch_session:research"
         )
 
-    # Head Writer compiles pitches
-    logger.info("Head Writer compiling pitches...")
-    head_writer = HeadWriterAgent(config, llm)
-    compile_context = AgentContext(
-        show_bible=state["show_bible"],
-        creative_prompt=state["creative_prompt"],
-        task_type="compile_pitches",
-        session_id=state.get("session_id"),
-        previous_output="\n\n---\n\n".join([p["content"] for p in all_pitches]),
-        additional_context={"research_notes": state.get("research_notes_pitches", {})},
-    )
-    compile_result = await head_writer.execute(compile_context)
-    if compile_result.success:
+    if isinstance(compile_result, Exception):
+        logger.error("Head Writer failed: %s", compile_result)
+        state = add_error(state, str(compile_result), "pitch_session:compile")
+    elif compile_result.success:
         state["compiled_pitches"] = compile_result.content
         state = _update_tokens_from_output(state, compile_result)
     else:
@@ -233,7 +328,7 @@ async def showrunner_select_node(state: SketchState) -> SketchState:
         selected_content = [p["content"] for p in all_pitches]
 
     # Showrunner makes final selection
-    showrunner = ShowrunnerAgent(config, llm)
+    showrunner = _agent(ShowrunnerAgent, config, llm)
     context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -281,10 +376,10 @@ async def story_breaking_node(state: SketchState) -> SketchState:
     vision_notes = state.get("showrunner_vision_notes", "")
 
     # Parallel contributions from writers
-    senior_a = SeniorWriterA(config, llm)
-    senior_b = SeniorWriterB(config, llm)
-    staff_b = StaffWriterB(config, llm)
-    research = ResearchAgent(config, llm)
+    senior_a = _agent(SeniorWriterA, config, llm)
+    senior_b = _agent(SeniorWriterB, config, llm)
+    staff_b = _agent(StaffWriterB, config, llm)
+    research = _agent(ResearchAgent, config, llm)
 
     base_context = {
         "show_bible": state["show_bible"],
@@ -294,13 +389,54 @@ async def story_breaking_node(state: SketchState) -> SketchState:
         "direction_notes": vision_notes,
     }
 
+    # Story Editor validation only needs the character details and the
+    # structural framework, so it starts as soon as those two contributions
+    # land while the joke map and research details are still in flight.
+    story_editor = _agent(StoryEditorAgent, config, llm)
+
+    def _contribution(result: Any, field_name: str) -> str:
+        """Content of a fresh contribution, falling back to the current state."""
+        if not isinstance(result, Exception) and result.success:
+            return result.content
+        return state.get(field_name, {}).get("content", "N/A")
+
+    async def _validate(characters_task: asyncio.Future, structure_task: asyncio.Future) -> Any:
+        characters, structure = await asyncio.gather(
+            characters_task, structure_task, return_exceptions=True
+        )
+        logger.info("Story Editor validating structure...")
+        validation_context = AgentContext(
+            show_bible=state["show_bible"],
+            creative_prompt=state["creative_prompt"],
+            task_type="validate_beat_sheet",
+            session_id=state.get("session_id"),
+            previous_output=f"""
+Selected Pitch:
+{selected_pitch}
+
+Character Details:
+{_contribution(characters, 'character_details')}
+
+Structural Framework:
+{_contribution(structure, 'structural_framework')}
+""",
+        )
+        return await story_editor.execute(validation_context)
+
     # Execute contributions in parallel
     logger.info("Gathering story breaking contributions in parallel...")
-    results = await asyncio.gather(
-        senior_a.execute(AgentContext(**base_context, task_type="develop_characters")),
-        senior_b.execute(AgentContext(**base_context, task_type="map_jokes")),
-        staff_b.execute(AgentContext(**base_context, task_type="propose_structure")),
-        research.execute(AgentContext(**base_context, task_type="provide_details")),
+    tasks = [
+        _start(agent.execute(AgentContext(**base_context, task_type=task_type)))
+        for agent, task_type in (
+            (senior_a, "develop_characters"),
+            (senior_b, "map_jokes"),
+            (staff_b, "propose_structure"),
+            (research, "provide_details"),
+        )
+    ]
+    *results, validation_result = await asyncio.gather(
+        *tasks,
+        _start(_validate(tasks[0], tasks[2])),
         return_exceptions=True,
     )
 
@@ -321,27 +457,10 @@ async def story_breaking_node(state: SketchState) -> SketchState:
                 state, result.error_message or "Unknown error", f"story_breaking:{agent_names[i]}"
             )
 
-    # Story Editor validates
-    logger.info("Story Editor validating structure...")
-    story_editor = StoryEditorAgent(config, llm)
-    validation_context = AgentContext(
-        show_bible=state["show_bible"],
-        creative_prompt=state["creative_prompt"],
-        task_type="validate_beat_sheet",
-        session_id=state.get("session_id"),
-        previous_output=f"""
-Selected Pitch:
-{selected_pitch}
-
-Character Details:
-{state.get('character_details', {}).get('content', 'N/A')}
-
-Structural Framework:
-{state.get('structural_framework', {}).get('content', 'N/A')}
-""",
-    )
-    validation_result = await story_editor.execute(validation_context)
-    if validation_result.success:
+    if isinstance(validation_result, Exception):
+        logger.error("Story Editor failed: %s", validation_result)
+        state = add_error(state, str(validation_result), "story_breaking:validation")
+    elif validation_result.success:
         state["story_editor_validation"] = {"content": validation_result.content}
         state = _update_tokens_from_output(state, validation_result)
     else:
@@ -353,7 +472,7 @@ Structural Framework:
 
     # Head Writer synthesizes beat sheet
     logger.info("Head Writer synthesizing beat sheet...")
-    head_writer = HeadWriterAgent(config, llm)
+    head_writer = _agent(HeadWriterAgent, config, llm)
     synthesis_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -426,7 +545,8 @@ async def drafting_node(state: SketchState) -> SketchState:
     """
     Stage 3: Script drafting.
 
-    Head Writer assigns sections, Senior Writers draft, then assembled.
+    Head Writer assigns sections and Senior Writers draft them. The Head
+    Writer then assembles the draft while the Showrunner reviews the sections.
     """
     logger.info("=== STAGE 3: SCRIPT DRAFTING ===")
     state = update_stage(state, WorkflowStage.SCRIPT_DRAFTING)
@@ -438,7 +558,7 @@ async def drafting_node(state: SketchState) -> SketchState:
 
     # Head Writer assigns sections
     logger.info("Head Writer assigning drafting sections...")
-    head_writer = HeadWriterAgent(config, llm)
+    head_writer = _agent(HeadWriterAgent, config, llm)
     assignment_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -458,8 +578,8 @@ async def drafting_node(state: SketchState) -> SketchState:
 
     # Senior Writers draft sections in parallel
     logger.info("Senior Writers drafting sections in parallel...")
-    senior_a = SeniorWriterA(config, llm)
-    senior_b = SeniorWriterB(config, llm)
+    senior_a = _agent(SeniorWriterA, config, llm)
+    senior_b = _agent(SeniorWriterB, config, llm)
 
     draft_context_base = {
         "show_bible": state["show_bible"],
@@ -474,7 +594,7 @@ Section Assignments:
 """,
     }
 
-    draft_results = await asyncio.gather(
+    draft_results = await _gather_agents(
         senior_a.execute(
             AgentContext(
                 **draft_context_base,
@@ -489,7 +609,6 @@ Section Assignments:
                 previous_output="Draft dialogue-intensive sections",
             )
         ),
-        return_exceptions=True,
     )
 
     drafted_sections = []
@@ -505,18 +624,38 @@ Section Assignments:
 
     state["drafted_sections"] = drafted_sections
 
-    # Head Writer assembles draft
-    logger.info("Head Writer assembling first draft...")
+    # Head Writer assembles the draft while the Showrunner reviews the same
+    # drafted sections. No later stage reads the review notes, so waiting for
+    # the assembled draft before reviewing would only add a round-trip.
+    logger.info("Head Writer assembling first draft while Showrunner reviews sections...")
+    sections_text = "\n\n---\n\n".join([s["content"] for s in drafted_sections])
+    beat_sheet_notes = f"Beat Sheet:\n{beat_sheet}"
     assemble_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
         task_type="assemble_draft",
         session_id=state.get("session_id"),
-        previous_output="\n\n---\n\n".join([s["content"] for s in drafted_sections]),
-        direction_notes=f"Beat Sheet:\n{beat_sheet}",
+        previous_output=sections_text,
+        direction_notes=beat_sheet_notes,
     )
-    assemble_result = await head_writer.execute(assemble_context)
-    if assemble_result.success:
+    showrunner = _agent(ShowrunnerAgent, config, llm)
+    review_context = AgentContext(
+        show_bible=state["show_bible"],
+        creative_prompt=state["creative_prompt"],
+        task_type="review_draft",
+        session_id=state.get("session_id"),
+        previous_output=sections_text,
+        direction_notes=beat_sheet_notes,
+    )
+    assemble_result, review_result = await _gather_agents(
+        head_writer.execute(assemble_context),
+        showrunner.execute(review_context),
+    )
+
+    if isinstance(assemble_result, Exception):
+        logger.error("Head Writer failed: %s", assemble_result)
+        state = add_error(state, str(assemble_result), "drafting:assembly")
+    elif assemble_result.success:
         state["first_draft"] = assemble_result.content
         state = _update_tokens_from_output(state, assemble_result)
     else:
@@ -524,19 +663,10 @@ Section Assignments:
             state, assemble_result.error_message or "Assembly failed", "drafting:assembly"
         )
 
-    # Showrunner reviews draft
-    logger.info("Showrunner reviewing first draft...")
-    showrunner = ShowrunnerAgent(config, llm)
-    review_context = AgentContext(
-        show_bible=state["show_bible"],
-        creative_prompt=state["creative_prompt"],
-        task_type="review_draft",
-        session_id=state.get("session_id"),
-        previous_output=state.get("first_draft", ""),
-        direction_notes=f"Beat Sheet:\n{beat_sheet}",
-    )
-    review_result = await showrunner.execute(review_context)
-    if review_result.success:
+    if isinstance(review_result, Exception):
+        logger.error("Showrunner failed: %s", review_result)
+        state = add_error(state, str(review_result), "drafting:showrunner_review")
+    elif review_result.success:
         state["showrunner_draft_notes"] = review_result.content
         state = _update_tokens_from_output(state, review_result)
     else:
@@ -577,29 +707,27 @@ async def table_read_node(state: SketchState) -> SketchState:
         "task_type": "table_read_review",
     }
 
-    # Create a modified context for Research agent (different task type)
-    research_context = {
-        **review_context_base,
-        "task_type": "fact_check",
-    }
+    # Writers share one review context (agents never mutate it); the
+    # Research agent gets its own for the different task type
+    review_context = AgentContext(**review_context_base)
+    research_context = AgentContext(**{**review_context_base, "task_type": "fact_check"})
 
     # Initialize all reviewing agents
-    senior_a = SeniorWriterA(config, llm)
-    senior_b = SeniorWriterB(config, llm)
-    staff_a = StaffWriterA(config, llm)
-    staff_b = StaffWriterB(config, llm)
-    research = ResearchAgent(config, llm)
-    story_editor = StoryEditorAgent(config, llm)
+    senior_a = _agent(SeniorWriterA, config, llm)
+    senior_b = _agent(SeniorWriterB, config, llm)
+    staff_a = _agent(StaffWriterA, config, llm)
+    staff_b = _agent(StaffWriterB, config, llm)
+    research = _agent(ResearchAgent, config, llm)
+    story_editor = _agent(StoryEditorAgent, config, llm)
 
     # Execute reviews in parallel
     logger.info("Executing table read with 6 agents in parallel...")
-    results = await asyncio.gather(
-        senior_a.execute(AgentContext(**review_context_base)),
-        senior_b.execute(AgentContext(**review_context_base)),
-        staff_a.execute(AgentContext(**review_context_base)),
-        staff_b.execute(AgentContext(**review_context_base)),
-        research.execute(AgentContext(**research_context)),
-        return_exceptions=True,
+    results = await _gather_agents(
+        senior_a.execute(review_context),
+        senior_b.execute(review_context),
+        staff_a.execute(review_context),
+        staff_b.execute(review_context),
+        research.execute(research_context),
     )
 
     # Collect feedback
@@ -644,7 +772,7 @@ First Draft:
 {first_draft}
 
 Agent Feedback:
-{chr(10).join([f"=== {f['agent']} ({f['focus_area']}) ==={chr(10)}{f['content']}" for f in feedback_list])}
+{_format_contributions(feedback_list, with_focus=True)}
 """,
     )
     compile_result = await story_editor.execute(compile_context)
@@ -658,7 +786,7 @@ Agent Feedback:
 
     # Head Writer creates revision plan
     logger.info("Head Writer creating revision plan...")
-    head_writer = HeadWriterAgent(config, llm)
+    head_writer = _agent(HeadWriterAgent, config, llm)
     plan_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -672,7 +800,7 @@ Story Editor Report:
 {state.get('story_editor_report', 'N/A')}
 
 All Feedback:
-{chr(10).join([f"=== {f['agent']} ==={chr(10)}{f['content']}" for f in feedback_list])}
+{_format_contributions(feedback_list)}
 """,
     )
     plan_result = await head_writer.execute(plan_context)
@@ -705,13 +833,14 @@ async def revision_node(state: SketchState) -> SketchState:
 
     config, llm = _get_config_and_llm(state)
 
-    current_draft = state.get("revised_draft") or state.get("first_draft", "")
+    previous_revision = state.get("revised_draft", "")
+    current_draft = previous_revision or state.get("first_draft", "")
     revision_plan = state.get("revision_plan", "")
     beat_sheet = state.get("beat_sheet", "")
 
     # Senior Writers execute revisions in parallel
-    senior_a = SeniorWriterA(config, llm)
-    senior_b = SeniorWriterB(config, llm)
+    senior_a = _agent(SeniorWriterA, config, llm)
+    senior_b = _agent(SeniorWriterB, config, llm)
 
     revision_base = {
         "show_bible": state["show_bible"],
@@ -722,10 +851,9 @@ async def revision_node(state: SketchState) -> SketchState:
     }
 
     logger.info("Executing revisions in parallel...")
-    results = await asyncio.gather(
+    results = await _gather_agents(
         senior_a.execute(AgentContext(**revision_base, task_type="fix_character_issues")),
         senior_b.execute(AgentContext(**revision_base, task_type="punch_up")),
-        return_exceptions=True,
     )
 
     revised_sections = []
@@ -743,7 +871,7 @@ async def revision_node(state: SketchState) -> SketchState:
 
     # Head Writer integrates revisions
     logger.info("Head Writer integrating revisions...")
-    head_writer = HeadWriterAgent(config, llm)
+    head_writer = _agent(HeadWriterAgent, config, llm)
     integrate_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -754,7 +882,7 @@ Current Draft:
 {current_draft}
 
 Revisions:
-{chr(10).join([f"=== {s['agent']} ==={chr(10)}{s['content']}" for s in revised_sections])}
+{_format_contributions(revised_sections)}
 """,
     )
     integrate_result = await head_writer.execute(integrate_context)
@@ -766,27 +894,30 @@ Revisions:
             state, integrate_result.error_message or "Integration failed", "revision:integrate"
         )
 
-    # Showrunner reviews revision
-    logger.info("Showrunner reviewing revision...")
-    showrunner = ShowrunnerAgent(config, llm)
-    review_context = AgentContext(
-        show_bible=state["show_bible"],
-        creative_prompt=state["creative_prompt"],
-        task_type="review_draft",
-        session_id=state.get("session_id"),
-        previous_output=state.get("revised_draft", ""),
-    )
-    review_result = await showrunner.execute(review_context)
-    if review_result.success:
-        # Check if approved (simplified - real implementation would parse response)
-        state["showrunner_revision_approved"] = (
-            "approved" in review_result.content.lower() or "strong" in review_result.content.lower()
-        )
-        state = _update_tokens_from_output(state, review_result)
+    # Showrunner reviews revision. If integration left the previous cycle's
+    # draft unchanged, the previous verdict still stands.
+    if previous_revision and state.get("revised_draft") == previous_revision:
+        logger.info("Skipping Showrunner review: revised draft unchanged since last cycle")
     else:
-        state = add_error(
-            state, review_result.error_message or "Review failed", "revision:showrunner"
+        logger.info("Showrunner reviewing revision...")
+        showrunner = _agent(ShowrunnerAgent, config, llm)
+        review_context = AgentContext(
+            show_bible=state["show_bible"],
+            creative_prompt=state["creative_prompt"],
+            task_type="review_draft",
+            session_id=state.get("session_id"),
+            previous_output=state.get("revised_draft", ""),
         )
+        review_result = await showrunner.execute(review_context)
+        if review_result.success:
+            # Check if approved (simplified - real implementation would parse response)
+            review = review_result.content.lower()
+            state["showrunner_revision_approved"] = "approved" in review or "strong" in review
+            state = _update_tokens_from_output(state, review_result)
+        else:
+            state = add_error(
+                state, review_result.error_message or "Review failed", "revision:showrunner"
+            )
 
     logger.info("Revision cycle %d complete", state["iteration_count"])
     return state
@@ -801,7 +932,8 @@ async def polish_node(state: SketchState) -> SketchState:
     """
     Stage 6: Polish and finalize.
 
-    Script Coordinator formats, QA validates, Showrunner gives final review.
+    Script Coordinator formats, then QA validates while the Showrunner gives
+    the final review.
     """
     logger.info("=== STAGE 6: POLISH & FINALIZE ===")
     state = update_stage(state, WorkflowStage.POLISH)
@@ -813,7 +945,7 @@ async def polish_node(state: SketchState) -> SketchState:
 
     # Script Coordinator formats
     logger.info("Script Coordinator formatting script...")
-    coordinator = ScriptCoordinatorAgent(config, llm)
+    coordinator = _agent(ScriptCoordinatorAgent, config, llm)
     format_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -845,9 +977,11 @@ async def polish_node(state: SketchState) -> SketchState:
         state["formatted_script"] = draft
         state["formatting_note"] = "Draft used as formatted script (formatting error)"
 
-    # QA Agent validates
-    logger.info("QA Agent performing final validation...")
-    qa = QAAgent(config, llm)
+    # QA Agent validates while the Showrunner gives the final review. Both
+    # read the formatted script; the final review prompt does not include
+    # the QA report, so neither waits for the other.
+    logger.info("QA Agent validating while Showrunner performs final review...")
+    qa = _agent(QAAgent, config, llm)
     qa_context = AgentContext(
         show_bible=state["show_bible"],
         creative_prompt=state["creative_prompt"],
@@ -856,8 +990,23 @@ async def polish_node(state: SketchState) -> SketchState:
         previous_output=state.get("formatted_script", ""),
         direction_notes=f"Beat Sheet:\n{state.get('beat_sheet', '')}",
     )
-    qa_result = await qa.execute(qa_context)
-    if qa_result.success:
+    showrunner = _agent(ShowrunnerAgent, config, llm)
+    final_context = AgentContext(
+        show_bible=state["show_bible"],
+        creative_prompt=state["creative_prompt"],
+        task_type="final_approval",
+        session_id=state.get("session_id"),
+        previous_output=state.get("formatted_script", ""),
+    )
+    qa_result, final_result = await _gather_agents(
+        qa.execute(qa_context),
+        showrunner.execute(final_context),
+    )
+
+    if isinstance(qa_result, Exception):
+        logger.error("QA Agent failed: %s", qa_result)
+        state = add_error(state, str(qa_result), "polish:qa")
+    elif qa_result.success:
         state["qa_report"] = {
             "content": qa_result.content,
             "approved": "approved" in qa_result.content.lower(),
@@ -866,19 +1015,10 @@ async def polish_node(state: SketchState) -> SketchState:
     else:
         state = add_error(state, qa_result.error_message or "QA failed", "polish:qa")
 
-    # Showrunner final review
-    logger.info("Showrunner performing final review...")
-    showrunner = ShowrunnerAgent(config, llm)
-    final_context = AgentContext(
-        show_bible=state["show_bible"],
-        creative_prompt=state["creative_prompt"],
-        task_type="final_approval",
-        session_id=state.get("session_id"),
-        previous_output=state.get("formatted_script", ""),
-        additional_context={"qa_report": state.get("qa_report", {})},
-    )
-    final_result = await showrunner.execute(final_context)
-    if final_result.success:
+    if isinstance(final_result, Exception):
+        logger.error("Showrunner failed: %s", final_result)
+        state = add_error(state, str(final_result), "polish:final")
+    elif final_result.success:
         state["showrunner_final_review"] = final_result.content
         state = _update_tokens_from_output(state, final_result)
     else:
@@ -918,51 +1058,35 @@ async def human_final_review_node(state: SketchState) -> SketchState:
 # =============================================================================
 
 
-def pitch_session_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for pitch_session_node."""
-    return asyncio.run(pitch_session_node(state))
-
-
-def human_pitch_review_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for human_pitch_review_node."""
-    return asyncio.run(human_pitch_review_node(state))
-
-
-def showrunner_select_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for showrunner_select_node."""
-    return asyncio.run(showrunner_select_node(state))
-
-
-def story_breaking_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for story_breaking_node."""
-    return asyncio.run(story_breaking_node(state))
-
-
-def human_beat_review_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for human_beat_review_node."""
-    return asyncio.run(human_beat_review_node(state))
-
-
-def drafting_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for drafting_node."""
-    return asyncio.run(drafting_node(state))
-
-
-def table_read_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for table_read_node."""
-    return asyncio.run(table_read_node(state))
-
-
-def revision_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for revision_node."""
-    return asyncio.run(revision_node(state))
-
+def _sync_wrapper(
+    node: Callable[[SketchState], Coroutine[Any, Any, SketchState]],
+) -> Callable[[SketchState], SketchState]:
+    """
+    Build a synchronous wrapper for an async node.
 
-def polish_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for polish_node."""
-    return asyncio.run(polish_node(state))
+    Args:
+        node: Async node function.
 
+    Returns:
+        Function that runs the node on the shared sync event loop.
+    """
 
-def human_final_review_node_sync(state: SketchState) -> SketchState:
-    """Synchronous wrapper for human_final_review_node."""
-    return asyncio.run(human_final_review_node(state))
+    def wrapper(state: SketchState) -> SketchState:
+        return run_sync(node(state))
+
+    wrapper.__name__ = wrapper.__qualname__ = f"{node.__name__}_sync"
+    wrapper.__doc__ = f"Synchronous wrapper for {node.__name__}."
+    wrapper.__wrapped__ = node
+    return wrapper
+
+
+pitch_session_node_sync = _sync_wrapper(pitch_session_node)
+human_pitch_review_node_sync = _sync_wrapper(human_pitch_review_node)
+showrunner_select_node_sync = _sync_wrapper(showrunner_select_node)
+story_breaking_node_sync = _sync_wrapper(story_breaking_node)
+human_beat_review_node_sync = _sync_wrapper(human_beat_review_node)
+drafting_node_sync = _sync_wrapper(drafting_node)
+table_read_node_sync = _sync_wrapper(table_read_node)
+revision_node_sync = _sync_wrapper(revision_node)
+polish_node_sync = _sync_wrapper(polish_node)
+human_final_review_node_sync = _sync_wrapper(human_final_review_node)
@@ -9,12 +9,18 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Annotated, Any, Optional, TypedDict
 
 from langgraph.graph import add_messages
 
 logger = logging.getLogger(__name__)
 
+# Read-only stand-in for a state that has no token usage recorded yet
+_EMPTY_TOKEN_USAGE = MappingProxyType(
+    {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+)
+
 
 class WorkflowStage(Enum):
     """Enumeration of workflow stages."""
@@ -33,7 +39,7 @@ class WorkflowStage(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class Pitch:
     """A single pitch concept from a writer."""
 
@@ -77,7 +83,7 @@ class Pitch:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TableReadFeedback:
     """Feedback from a single agent during table read."""
 
@@ -100,7 +106,7 @@ class TableReadFeedback:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QAReport:
     """Quality assurance report from QA agent."""
 
@@ -379,14 +385,15 @@ def update_stage(state: SketchState, new_stage: WorkflowStage) -> SketchState:
     """
     logger.info("Transitioning from %s to %s", state.get("current_stage"), new_stage.value)
 
-    history = state.get("stage_history", [])
-    history.append(
+    # Build a new list so earlier states (and checkpoints) keep their history
+    history = [
+        *state.get("stage_history", []),
         {
             "stage": new_stage.value,
             "timestamp": datetime.now().isoformat(),
             "status": "started",
-        }
-    )
+        },
+    ]
 
     return {
         **state,
@@ -409,15 +416,15 @@ def add_error(state: SketchState, error: str, context: Optional[str] = None) ->
     """
     logger.error("Workflow error: %s (context: %s)", error, context)
 
-    error_log = state.get("error_log", [])
-    error_log.append(
+    error_log = [
+        *state.get("error_log", []),
         {
             "error": error,
             "context": context,
             "stage": state.get("current_stage"),
             "timestamp": datetime.now().isoformat(),
-        }
-    )
+        },
+    ]
 
     return {**state, "error_log": error_log}
 
@@ -438,9 +445,7 @@ def update_token_usage(
     Returns:
         Updated state with token usage added.
     """
-    usage = state.get(
-        "token_usage", {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-    )
+    usage = state.get("token_usage") or _EMPTY_TOKEN_USAGE
 
     new_usage = {
         "prompt_tokens": usage["prompt_tokens"] + prompt_tokens,
@@ -10,14 +10,30 @@ This module provides:
 
 import os
 import tempfile
+from collections import deque
 from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.agents import (
+    AgentRole,
+    BaseAgent,
+    HeadWriterAgent,
+    QAAgent,
+    ResearchAgent,
+    ScriptCoordinatorAgent,
+    SeniorWriterA,
+    SeniorWriterB,
+    ShowrunnerAgent,
+    StaffWriterA,
+    StaffWriterB,
+    StoryEditorAgent,
+)
 from src.utils.config import Config, LLMConfig, ShowConfig, WorkflowConfig
 from src.utils.llm import LLMInterface, LLMResponse, ModelTier, TokenUsage
+from src.utils.rate_limit import estimate_tokens
 from src.workflow.state import SketchState, create_initial_state
 
 # =============================================================================
@@ -140,6 +156,44 @@ def sample_creative_prompt() -> str:
     return SAMPLE_CREATIVE_PROMPT
 
 
+def _populate_project_dir(root: Path, show_bible: str, creative_prompt: str) -> None:
+    """
+    Lay out a test project tree under root.
+
+    Args:
+        root: Empty directory to populate.
+        show_bible: Show bible content.
+        creative_prompt: Creative prompt content.
+    """
+    # Create directory structure
+    shows_dir = root / "Shows" / "test_show"
+    shows_dir.mkdir(parents=True)
+    (shows_dir / "output").mkdir()
+
+    # Create config files
+    (root / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+    (root / ".env").write_text("ANTHROPIC_API_KEY=test-key-12345\nSHOW_FOLDER=test_show\n")
+
+    # Create show files
+    (shows_dir / "show_bible.md").write_text(show_bible)
+    (shows_dir / "creative_prompt.md").write_text(creative_prompt)
+
+    # Create Docs directory with agent prompts
+    docs_dir = root / "Docs"
+    docs_dir.mkdir()
+    (docs_dir / "agent-prompts.md").write_text("# Agent Prompts\nTest content")
+
+    # Create config/agents directory with all agent markdown files
+    config_dir = root / "config" / "agents"
+    config_dir.mkdir(parents=True)
+
+    # Copy ALL agent markdown files from the real config directory
+    real_agents_dir = Path(__file__).parent.parent / "config" / "agents"
+    if real_agents_dir.exists():
+        for agent_file in real_agents_dir.glob("*.md"):
+            (config_dir / agent_file.name).write_text(agent_file.read_text())
+
+
 @pytest.fixture
 def temp_project_dir(
     sample_show_bible: str,
@@ -153,36 +207,23 @@ def temp_project_dir(
     """
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
+        _populate_project_dir(root, sample_show_bible, sample_creative_prompt)
+        yield root
 
-        # Create directory structure
-        shows_dir = root / "Shows" / "test_show"
-        shows_dir.mkdir(parents=True)
-        (shows_dir / "output").mkdir()
-
-        # Create config files
-        (root / "pyproject.toml").write_text("[project]\nname = 'test'\n")
-        (root / ".env").write_text("ANTHROPIC_API_KEY=test-key-12345\nSHOW_FOLDER=test_show\n")
-
-        # Create show files
-        (shows_dir / "show_bible.md").write_text(sample_show_bible)
-        (shows_dir / "creative_prompt.md").write_text(sample_creative_prompt)
-
-        # Create Docs directory with agent prompts
-        docs_dir = root / "Docs"
-        docs_dir.mkdir()
-        (docs_dir / "agent-prompts.md").write_text("# Agent Prompts\nTest content")
 
-        # Create config/agents directory with all agent markdown files
-        config_dir = root / "config" / "agents"
-        config_dir.mkdir(parents=True)
+@pytest.fixture(scope="session")
+def session_project_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    Create a project directory shared by the whole test session.
 
-        # Copy ALL agent markdown files from the real config directory
-        real_agents_dir = Path(__file__).parent.parent / "config" / "agents"
-        if real_agents_dir.exists():
-            for agent_file in real_agents_dir.glob("*.md"):
-                (config_dir / agent_file.name).write_text(agent_file.read_text())
+    Only for tests that never write to the project tree.
 
-        yield root
+    Returns:
+        Path to shared project root.
+    """
+    root = tmp_path_factory.mktemp("project")
+    _populate_project_dir(root, SAMPLE_SHOW_BIBLE, SAMPLE_CREATIVE_PROMPT)
+    return root
 
 
 @pytest.fixture
@@ -246,6 +287,35 @@ def mock_config(
     )
 
 
+@pytest.fixture(scope="session")
+def session_mock_config(session_project_dir: Path) -> Config:
+    """
+    Create a complete mock configuration shared by the whole test session.
+
+    Only for tests that never modify the configuration.
+    """
+    from src.config.agent_loader import AgentLoader
+
+    return Config(
+        llm=LLMConfig(
+            provider="anthropic",
+            api_key="test-api-key-12345",
+            creative_model="claude-sonnet-4-20250514",
+            support_model="claude-3-5-haiku-20241022",
+        ),
+        workflow=WorkflowConfig(max_revision_cycles=3, target_sketch_length=5),
+        show=ShowConfig(
+            show_folder="test_show",
+            show_bible=SAMPLE_SHOW_BIBLE,
+            creative_prompt=SAMPLE_CREATIVE_PROMPT,
+            output_dir=session_project_dir / "Shows" / "test_show" / "output",
+        ),
+        project_root=session_project_dir,
+        debug=True,
+        agent_loader=AgentLoader(session_project_dir / "config" / "agents"),
+    )
+
+
 # =============================================================================
 # LLM MOCK FIXTURES
 # =============================================================================
@@ -269,7 +339,7 @@ class MockLLMInterface(LLMInterface):
         super().__init__(config)
         self.default_response = default_response
         self.call_history: list[dict[str, Any]] = []
-        self.response_queue: list[str] = []
+        self.response_queue: deque[str] = deque()
 
     def set_response(self, response: str) -> None:
         """Set the next response to return."""
@@ -310,12 +380,12 @@ class MockLLMInterface(LLMInterface):
 
         # Get response
         if self.response_queue:
-            content = self.response_queue.pop(0)
+            content = self.response_queue.popleft()
         else:
             content = self.default_response
 
         # Simulate token usage
-        prompt_tokens = sum(len(str(m)) for m in messages) // 4
+        prompt_tokens = estimate_tokens(messages)
         completion_tokens = len(content) // 4
         total_tokens = prompt_tokens + completion_tokens
 
@@ -336,6 +406,46 @@ def mock_llm(mock_llm_config: LLMConfig) -> MockLLMInterface:
     return MockLLMInterface(mock_llm_config)
 
 
+@pytest.fixture(scope="session")
+def session_mock_llm(session_mock_config: Config) -> MockLLMInterface:
+    """
+    Create a mock LLM interface shared by the whole test session.
+
+    Only for tests that never call the LLM; call_history and queued
+    responses would leak between tests.
+    """
+    return MockLLMInterface(session_mock_config.llm)
+
+
+@pytest.fixture(scope="session")
+def prebuilt_agents(
+    session_mock_config: Config,
+    session_mock_llm: MockLLMInterface,
+) -> dict[AgentRole, BaseAgent]:
+    """
+    Build one instance of every agent for read-only tests.
+
+    Returns:
+        Mapping of agent role to agent instance.
+    """
+    agents = [
+        agent_cls(session_mock_config, session_mock_llm)
+        for agent_cls in (
+            ShowrunnerAgent,
+            HeadWriterAgent,
+            SeniorWriterA,
+            SeniorWriterB,
+            StaffWriterA,
+            StaffWriterB,
+            StoryEditorAgent,
+            ResearchAgent,
+            ScriptCoordinatorAgent,
+            QAAgent,
+        )
+    ]
+    return {agent.role: agent for agent in agents}
+
+
 @pytest.fixture
 def mock_llm_with_pitches(mock_llm_config: LLMConfig) -> MockLLMInterface:
     """Create a mock LLM that returns pitch-like responses."""
@@ -36,6 +36,14 @@ from src.agents import (
 from src.utils.config import Config
 from src.utils.llm import LLMResponse, ModelTier
 
+
+def _message_text(message) -> str:
+    """Return a message's text whether its content is a string or text blocks."""
+    if isinstance(message.content, str):
+        return message.content
+    return "\n".join(block["text"] for block in message.content)
+
+
 # =============================================================================
 # AGENT ROLE TESTS
 # =============================================================================
@@ -279,27 +287,113 @@ class TestGetAgentDescription:
 # =============================================================================
 
 
-class TestShowrunnerAgent:
-    """Tests for ShowrunnerAgent."""
+# (agent class, role, model tier, headings, keywords)
+# Each headings group needs one term present in the system prompt verbatim;
+# each keywords group needs one term present case-insensitively.
+AGENT_CASES = [
+    (
+        ShowrunnerAgent,
+        AgentRole.SHOWRUNNER,
+        ModelTier.CREATIVE,
+        [("SHOWRUNNER",)],
+        [("creative authority",), ("final",)],
+    ),
+    (
+        HeadWriterAgent,
+        AgentRole.HEAD_WRITER,
+        ModelTier.CREATIVE,
+        [("HEAD WRITER",)],
+        [("manage", "orchestrate")],
+    ),
+    (
+        SeniorWriterA,
+        AgentRole.SENIOR_WRITER_A,
+        ModelTier.CREATIVE,
+        [("SENIOR WRITER A",)],
+        [("premise", "character")],
+    ),
+    (
+        SeniorWriterB,
+        AgentRole.SENIOR_WRITER_B,
+        ModelTier.CREATIVE,
+        [("SENIOR WRITER",), ("B",)],
+        [("dialogue",)],
+    ),
+    (
+        StaffWriterA,
+        AgentRole.STAFF_WRITER_A,
+        ModelTier.CREATIVE,
+        [("STAFF WRITER A",)],
+        [("pitch",)],
+    ),
+    (
+        StaffWriterB,
+        AgentRole.STAFF_WRITER_B,
+        ModelTier.CREATIVE,
+        [("STAFF WRITER",), ("B",)],
+        [("structure",)],
+    ),
+    (
+        StoryEditorAgent,
+        AgentRole.STORY_EDITOR,
+        ModelTier.SUPPORT,
+        [("STORY EDITOR",)],
+        [("continuity", "consistency")],
+    ),
+    (
+        ResearchAgent,
+        AgentRole.RESEARCH,
+        ModelTier.SUPPORT,
+        [("RESEARCH",)],
+        [("fact", "reference")],
+    ),
+    (
+        ScriptCoordinatorAgent,
+        AgentRole.SCRIPT_COORDINATOR,
+        ModelTier.SUPPORT,
+        [("SCRIPT COORDINATOR",)],
+        [("format",)],
+    ),
+    (
+        QAAgent,
+        AgentRole.QA,
+        ModelTier.SUPPORT,
+        [("QUALITY", "QA")],
+        [("validation", "quality")],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "agent_cls,role,tier,headings,keywords",
+    AGENT_CASES,
+    ids=[case[1].value for case in AGENT_CASES],
+)
+class TestAllAgents:
+    """Tests shared by all 10 concrete agents."""
 
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Showrunner agent initialization."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.SHOWRUNNER
-        assert agent.model_tier == ModelTier.CREATIVE
-        assert "Showrunner" in agent.name
+    def test_initialization(self, prebuilt_agents, agent_cls, role, tier, headings, keywords):
+        """Test agent role and model tier."""
+        agent = prebuilt_agents[role]
+        assert isinstance(agent, agent_cls)
+        assert agent.role == role
+        assert agent.model_tier == tier
+
+    def test_system_prompt(self, prebuilt_agents, agent_cls, role, tier, headings, keywords):
+        """Test system prompt contains the role's headings and keywords."""
+        prompt = prebuilt_agents[role].get_system_prompt()
+        for group in headings:
+            assert any(term in prompt for term in group), group
+        for group in keywords:
+            assert any(term in prompt.lower() for term in group), group
 
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Showrunner system prompt."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "SHOWRUNNER" in prompt
-        assert "creative authority" in prompt.lower()
-        assert "final" in prompt.lower()
 
-    def test_task_instructions_select_pitch(self, mock_config: Config, mock_llm):
+class TestShowrunnerAgent:
+    """Tests for ShowrunnerAgent."""
+
+    def test_task_instructions_select_pitch(self, prebuilt_agents):
         """Test Showrunner select_pitch task instructions."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SHOWRUNNER]
         context = AgentContext(
             show_bible="bible",
             creative_prompt="prompt",
@@ -309,9 +403,9 @@ class TestShowrunnerAgent:
         assert "SELECT" in instructions or "PITCH" in instructions
         assert "OUTPUT FORMAT" in instructions
 
-    def test_task_instructions_review_draft(self, mock_config: Config, mock_llm):
+    def test_task_instructions_review_draft(self, prebuilt_agents):
         """Test Showrunner review_draft task instructions."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SHOWRUNNER]
         context = AgentContext(
             show_bible="bible",
             creative_prompt="prompt",
@@ -320,9 +414,9 @@ class TestShowrunnerAgent:
         instructions = agent.get_task_instructions("review_draft", context)
         assert "REVIEW" in instructions or "DRAFT" in instructions
 
-    def test_task_instructions_final_approval(self, mock_config: Config, mock_llm):
+    def test_task_instructions_final_approval(self, prebuilt_agents):
         """Test Showrunner final_approval task instructions."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SHOWRUNNER]
         context = AgentContext(
             show_bible="bible",
             creative_prompt="prompt",
@@ -331,11 +425,11 @@ class TestShowrunnerAgent:
         instructions = agent.get_task_instructions("final_approval", context)
         assert "APPROVAL" in instructions or "APPROVED" in instructions
 
-    def test_unknown_task_type(self, mock_config: Config, mock_llm):
+    def test_unknown_task_type(self, prebuilt_agents):
         """Test Showrunner with unknown task type raises ConfigurationError."""
         from src.config.validation import ConfigurationError
 
-        agent = ShowrunnerAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SHOWRUNNER]
         context = AgentContext(
             show_bible="bible",
             creative_prompt="prompt",
@@ -354,159 +448,6 @@ class TestShowrunnerAgent:
             assert "unknown_task" in instructions
 
 
-class TestHeadWriterAgent:
-    """Tests for HeadWriterAgent."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Head Writer agent initialization."""
-        agent = HeadWriterAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.HEAD_WRITER
-        assert agent.model_tier == ModelTier.CREATIVE
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Head Writer system prompt."""
-        agent = HeadWriterAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "HEAD WRITER" in prompt
-        assert "manage" in prompt.lower() or "orchestrate" in prompt.lower()
-
-
-class TestSeniorWriterA:
-    """Tests for SeniorWriterA (premise/character specialist)."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Senior Writer A initialization."""
-        agent = SeniorWriterA(mock_config, mock_llm)
-        assert agent.role == AgentRole.SENIOR_WRITER_A
-        assert agent.model_tier == ModelTier.CREATIVE
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Senior Writer A system prompt."""
-        agent = SeniorWriterA(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "SENIOR WRITER A" in prompt
-        assert "premise" in prompt.lower() or "character" in prompt.lower()
-
-
-class TestSeniorWriterB:
-    """Tests for SeniorWriterB (dialogue specialist)."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Senior Writer B initialization."""
-        agent = SeniorWriterB(mock_config, mock_llm)
-        assert agent.role == AgentRole.SENIOR_WRITER_B
-        assert agent.model_tier == ModelTier.CREATIVE
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Senior Writer B system prompt."""
-        agent = SeniorWriterB(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "SENIOR WRITER" in prompt and "B" in prompt
-        assert "dialogue" in prompt.lower()
-
-
-class TestStaffWriterA:
-    """Tests for StaffWriterA (pitch generator)."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Staff Writer A initialization."""
-        agent = StaffWriterA(mock_config, mock_llm)
-        assert agent.role == AgentRole.STAFF_WRITER_A
-        assert agent.model_tier == ModelTier.CREATIVE
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Staff Writer A system prompt."""
-        agent = StaffWriterA(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "STAFF WRITER A" in prompt
-        assert "pitch" in prompt.lower()
-
-
-class TestStaffWriterB:
-    """Tests for StaffWriterB (structure specialist)."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Staff Writer B initialization."""
-        agent = StaffWriterB(mock_config, mock_llm)
-        assert agent.role == AgentRole.STAFF_WRITER_B
-        assert agent.model_tier == ModelTier.CREATIVE
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Staff Writer B system prompt."""
-        agent = StaffWriterB(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "STAFF WRITER" in prompt and "B" in prompt
-        assert "structure" in prompt.lower()
-
-
-class TestStoryEditorAgent:
-    """Tests for StoryEditorAgent."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Story Editor initialization."""
-        agent = StoryEditorAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.STORY_EDITOR
-        assert agent.model_tier == ModelTier.SUPPORT
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Story Editor system prompt."""
-        agent = StoryEditorAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "STORY EDITOR" in prompt
-        assert "continuity" in prompt.lower() or "consistency" in prompt.lower()
-
-
-class TestResearchAgent:
-    """Tests for ResearchAgent."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Research Agent initialization."""
-        agent = ResearchAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.RESEARCH
-        assert agent.model_tier == ModelTier.SUPPORT
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Research Agent system prompt."""
-        agent = ResearchAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "RESEARCH" in prompt
-        assert "fact" in prompt.lower() or "reference" in prompt.lower()
-
-
-class TestScriptCoordinatorAgent:
-    """Tests for ScriptCoordinatorAgent."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test Script Coordinator initialization."""
-        agent = ScriptCoordinatorAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.SCRIPT_COORDINATOR
-        assert agent.model_tier == ModelTier.SUPPORT
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test Script Coordinator system prompt."""
-        agent = ScriptCoordinatorAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "SCRIPT COORDINATOR" in prompt
-        assert "format" in prompt.lower()
-
-
-class TestQAAgent:
-    """Tests for QAAgent."""
-
-    def test_initialization(self, mock_config: Config, mock_llm):
-        """Test QA Agent initialization."""
-        agent = QAAgent(mock_config, mock_llm)
-        assert agent.role == AgentRole.QA
-        assert agent.model_tier == ModelTier.SUPPORT
-
-    def test_system_prompt(self, mock_config: Config, mock_llm):
-        """Test QA Agent system prompt."""
-        agent = QAAgent(mock_config, mock_llm)
-        prompt = agent.get_system_prompt()
-        assert "QUALITY" in prompt or "QA" in prompt
-        assert "validation" in prompt.lower() or "quality" in prompt.lower()
-
-
 # =============================================================================
 # AGENT EXECUTION TESTS
 # =============================================================================
@@ -555,8 +496,8 @@ class TestAgentExecution:
         # Check that the call included previous output
         assert len(mock_llm.call_history) == 1
         messages = mock_llm.call_history[0]["messages"]
-        # Messages are LangChain objects with .content attribute
-        user_message = messages[1].content
+        # User message content is split into shared-context and task blocks
+        user_message = _message_text(messages[1])
         assert "Previous Stage Output" in user_message
 
     @pytest.mark.asyncio
@@ -576,11 +517,28 @@ class TestAgentExecution:
 
         assert output.success is True
         messages = mock_llm.call_history[0]["messages"]
-        # Messages are LangChain objects with .content attribute
-        user_message = messages[1].content
+        # User message content is split into shared-context and task blocks
+        user_message = _message_text(messages[1])
         assert "Direction Notes" in user_message
         assert "absurdist" in user_message
 
+    @pytest.mark.asyncio
+    async def test_execute_puts_shared_context_first(self, mock_config: Config, mock_llm):
+        """Test that show context is sent as its own leading user block."""
+        agent = StaffWriterA(mock_config, mock_llm)
+        context = AgentContext(
+            show_bible="# MY BIBLE",
+            creative_prompt="# MY PROMPT",
+            task_type="generate_pitches",
+        )
+
+        await agent.execute(context)
+
+        shared_block, task_block = mock_llm.call_history[0]["messages"][1].content
+        assert "MY BIBLE" in shared_block["text"]
+        assert "MY PROMPT" in shared_block["text"]
+        assert task_block["text"].startswith("## CURRENT TASK: generate_pitches")
+
     @pytest.mark.asyncio
     async def test_execute_tracks_token_usage(self, mock_config: Config, mock_llm):
         """Test that execution tracks token usage."""
@@ -675,6 +633,24 @@ class TestBuildPrompt:
         assert "MY SHOW BIBLE CONTENT" in user_prompt
         assert "Show Bible" in user_prompt
 
+    @pytest.mark.asyncio
+    async def test_execute_sends_built_prompt(self, mock_config: Config, mock_llm):
+        """Test that execute() sends the same prompt build_prompt() returns."""
+        agent = ShowrunnerAgent(mock_config, mock_llm)
+        context = AgentContext(
+            show_bible="# MY SHOW BIBLE CONTENT",
+            creative_prompt="# Prompt",
+            task_type="select_pitch",
+        )
+        system_prompt, user_prompt = agent.build_prompt(context)
+
+        await agent.execute(context)
+
+        system_message, user_message = mock_llm.call_history[0]["messages"]
+        shared_block, task_block = user_message.content
+        assert _message_text(system_message) == system_prompt
+        assert f"{shared_block['text']}\n\n{task_block['text']}" == user_prompt
+
     def test_build_prompt_includes_creative_prompt(self, mock_config: Config, mock_llm):
         """Test that built prompt includes creative prompt."""
         agent = ShowrunnerAgent(mock_config, mock_llm)
@@ -719,6 +695,19 @@ class TestBuildPrompt:
         assert "Previous Stage Output" not in user_prompt
         assert "Direction Notes" not in user_prompt
 
+    def test_shared_context_rendered_once_per_show(self, mock_config: Config, mock_llm):
+        """Test that the shared show context is reused across agents and tasks."""
+        bible = "# Bible"
+        prompt = "# Prompt"
+        first = ShowrunnerAgent(mock_config, mock_llm).build_shared_context(
+            AgentContext(show_bible=bible, creative_prompt=prompt, task_type="select_pitch")
+        )
+        second = HeadWriterAgent(mock_config, mock_llm).build_shared_context(
+            AgentContext(show_bible=bible, creative_prompt=prompt, task_type="create_beat_sheet")
+        )
+
+        assert first is second
+
 
 # =============================================================================
 # AGENT NAME TESTS
@@ -728,27 +717,27 @@ class TestBuildPrompt:
 class TestAgentNames:
     """Tests for agent name property."""
 
-    def test_showrunner_name(self, mock_config: Config, mock_llm):
+    def test_showrunner_name(self, prebuilt_agents):
         """Test Showrunner name formatting."""
-        agent = ShowrunnerAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SHOWRUNNER]
         assert agent.name == "Showrunner"
 
-    def test_head_writer_name(self, mock_config: Config, mock_llm):
+    def test_head_writer_name(self, prebuilt_agents):
         """Test Head Writer name formatting."""
-        agent = HeadWriterAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.HEAD_WRITER]
         assert agent.name == "Head Writer"
 
-    def test_senior_writer_a_name(self, mock_config: Config, mock_llm):
+    def test_senior_writer_a_name(self, prebuilt_agents):
         """Test Senior Writer A name formatting."""
-        agent = SeniorWriterA(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.SENIOR_WRITER_A]
         assert agent.name == "Senior Writer A"
 
-    def test_staff_writer_b_name(self, mock_config: Config, mock_llm):
+    def test_staff_writer_b_name(self, prebuilt_agents):
         """Test Staff Writer B name formatting."""
-        agent = StaffWriterB(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.STAFF_WRITER_B]
         assert agent.name == "Staff Writer B"
 
-    def test_qa_name(self, mock_config: Config, mock_llm):
+    def test_qa_name(self, prebuilt_agents):
         """Test QA agent name formatting."""
-        agent = QAAgent(mock_config, mock_llm)
+        agent = prebuilt_agents[AgentRole.QA]
         assert agent.name == "Qa"  # Title case of "qa"
@@ -8,6 +8,7 @@ Tests the src/utils/config.py module including:
 - Validation and error handling
 """
 
+import dataclasses
 import os
 import tempfile
 from pathlib import Path
@@ -83,6 +84,17 @@ class TestLLMConfig:
                 support_model="",
             )
 
+    def test_invalid_max_concurrency_raises_error(self):
+        """Test that a concurrency cap below one raises ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="max_concurrency"):
+            LLMConfig(
+                provider="anthropic",
+                api_key="test-key",
+                creative_model="claude-sonnet-4-20250514",
+                support_model="claude-3-5-haiku-20241022",
+                max_concurrency=0,
+            )
+
 
 class TestWorkflowConfig:
     """Tests for WorkflowConfig dataclass."""
@@ -128,6 +140,17 @@ class TestShowConfig:
         assert "Show Bible" in config.show_bible
         assert "Creative Prompt" in config.creative_prompt
 
+    def test_show_config_is_immutable(self, temp_project_dir: Path):
+        """Test that loaded show config cannot be changed mid-session."""
+        config = ShowConfig(
+            show_folder="test_show",
+            show_bible="# Show Bible",
+            creative_prompt="# Creative Prompt",
+            output_dir=temp_project_dir / "output",
+        )
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.show_bible = "# Rewritten"
+
     def test_missing_show_folder_raises_error(self, temp_project_dir: Path):
         """Test that missing show_folder raises error."""
         with pytest.raises(ConfigurationError, match="show_folder"):
@@ -247,6 +270,67 @@ class TestLoadConfig:
             os.chdir(original_cwd)
 
 
+class TestLoadFileContent:
+    """Tests for cached show file loading."""
+
+    def test_reloads_after_file_changes(self, tmp_path: Path):
+        """Test that edits to a show file are picked up on the next load."""
+        from src.utils.config import _load_file_content
+
+        path = tmp_path / "creative_prompt.md"
+        path.write_text("First idea")
+        assert _load_file_content(path, "creative_prompt.md") == "First idea"
+
+        path.write_text("A much better second idea")
+        assert _load_file_content(path, "creative_prompt.md") == "A much better second idea"
+
+    def test_empty_file_rejected(self, tmp_path: Path):
+        """Test that whitespace-only files raise ConfigurationError."""
+        from src.utils.config import _load_file_content
+
+        path = tmp_path / "show_bible.md"
+        path.write_text("   \n")
+        with pytest.raises(ConfigurationError, match="is empty"):
+            _load_file_content(path, "show_bible.md")
+
+    def test_crlf_newlines_normalized(self, tmp_path: Path):
+        """Test that Windows line endings load the same as Unix ones."""
+        from src.utils.config import _load_file_content
+
+        path = tmp_path / "show_bible.md"
+        path.write_bytes(b"# Bible\r\nLine two\r\n")
+        assert _load_file_content(path, "show_bible.md") == "# Bible\nLine two\n"
+
+    def test_invalid_utf8_rejected(self, tmp_path: Path):
+        """Test that undecodable files raise ConfigurationError."""
+        from src.utils.config import _load_file_content
+
+        path = tmp_path / "show_bible.md"
+        path.write_bytes(b"\xff\xfe bad bytes")
+        with pytest.raises(ConfigurationError, match="Cannot decode"):
+            _load_file_content(path, "show_bible.md")
+
+
+class TestListAvailableShows:
+    """Tests for the available shows listing."""
+
+    def test_lists_only_directories(self, tmp_path: Path):
+        """Test that show folders are listed sorted and plain files skipped."""
+        from src.utils.config import _list_available_shows
+
+        (tmp_path / "zeta_show").mkdir()
+        (tmp_path / "alpha_show").mkdir()
+        (tmp_path / "README.md").write_text("notes")
+
+        assert _list_available_shows(tmp_path) == ["alpha_show", "zeta_show"]
+
+    def test_missing_shows_dir(self, tmp_path: Path):
+        """Test that a missing Shows/ directory yields no shows."""
+        from src.utils.config import _list_available_shows
+
+        assert _list_available_shows(tmp_path / "Shows") == []
+
+
 class TestGetAgentPromptsPath:
     """Tests for get_agent_prompts_path function."""
 
@@ -313,3 +397,176 @@ class TestConfigIntegration:
         # Directory should exist or be creatable
         output_dir.mkdir(parents=True, exist_ok=True)
         assert output_dir.exists()
+
+
+class TestAgentConfigurationError:
+    """Tests for the agent/workflow ConfigurationError in src/config/validation.py."""
+
+    def test_args_hold_short_message(self):
+        """Test that exception args carry only the problem description."""
+        from src.config.validation import ConfigurationError as AgentConfigError
+
+        error = AgentConfigError(
+            file_path=Path("config/agents/qa.md"),
+            message="Missing section",
+            suggestion="Add it",
+        )
+        assert error.args == ("Missing section",)
+
+    def test_str_formats_full_explanation(self):
+        """Test that str() renders location, problem, and fix."""
+        from src.config.validation import ConfigurationError as AgentConfigError
+
+        error = AgentConfigError(
+            file_path=Path("config/agents/qa.md"),
+            message="Missing section",
+            suggestion="Add it",
+            line_number=12,
+        )
+        text = str(error)
+        assert "config/agents/qa.md, line 12" in text
+        assert "Problem: Missing section" in text
+        assert "How to fix: Add it" in text
+
+
+SAMPLE_WORKFLOW_YAML = """
+version: "1.0"
+workflow_name: test_workflow
+settings:
+  max_revision_cycles: 2
+stages:
+  - id: 2
+    name: story_breaking
+    description: Build the beat sheet
+    agents:
+      - role: head_writer
+        task: synthesize_beat_sheet
+  - id: 1
+    name: pitch_session
+    description: Generate pitches
+    agents:
+      - role: staff_writer_a
+        task: generate_pitches
+routing_rules:
+  beat_sheet_review:
+    type: conditional
+    function: should_revise_beat_sheet
+    routes:
+      approved: END
+      needs_revision: story_breaking
+"""
+
+
+@pytest.fixture
+def workflow_path(tmp_path: Path) -> Path:
+    """Write a minimal workflow.yaml and return its path."""
+    path = tmp_path / "workflow.yaml"
+    path.write_text(SAMPLE_WORKFLOW_YAML)
+    return path
+
+
+class TestWorkflowLoader:
+    """Tests for WorkflowLoader stage queries."""
+
+    def test_get_stages_sorted_by_id(self, workflow_path: Path):
+        """Test that stages come back ordered by ID regardless of file order."""
+        from src.config.workflow_loader import WorkflowLoader
+
+        loader = WorkflowLoader(workflow_path)
+        assert [s.name for s in loader.get_stages()] == ["pitch_session", "story_breaking"]
+
+    def test_get_stage_by_name(self, workflow_path: Path):
+        """Test stage lookup by name, including unknown names."""
+        from src.config.workflow_loader import WorkflowLoader
+
+        loader = WorkflowLoader(workflow_path)
+        assert loader.get_stage("story_breaking").id == 2
+        assert loader.get_stage("no_such_stage") is None
+
+    def test_derived_views_are_cached(self, workflow_path: Path):
+        """Test that derived stage views are computed once per config."""
+        from src.config.workflow_loader import WorkflowLoader
+
+        config = WorkflowLoader(workflow_path).load()
+        assert config.sorted_stages is config.sorted_stages
+        assert config.stages_by_name is config.stages_by_name
+        assert "sorted_stages" not in config.model_dump()
+
+    def test_large_workflow_parsed_via_mmap(self, workflow_path: Path):
+        """Test that files above the mmap threshold parse identically."""
+        from src.config import workflow_loader
+        from src.config.workflow_loader import WorkflowLoader
+
+        padding = "# padding\n" * (workflow_loader.MMAP_THRESHOLD_BYTES // 10 + 1)
+        workflow_path.write_text(SAMPLE_WORKFLOW_YAML + padding)
+        assert workflow_path.stat().st_size > workflow_loader.MMAP_THRESHOLD_BYTES
+
+        config = WorkflowLoader(workflow_path).load()
+        assert config.workflow_name == "test_workflow"
+        assert config.settings.max_revision_cycles == 2
+
+
+def _make_agent_definition(role: str, tasks: list[str]):
+    """Build a minimal AgentDefinition declaring the given tasks."""
+    from src.config.validation import AgentDefinition, AgentMetadata, TaskDefinition
+
+    return AgentDefinition(
+        metadata=AgentMetadata(
+            role=role,
+            tier="creative",
+            model="test-model",
+            authority="high",
+            description="Test agent",
+            tasks={task: TaskDefinition(output_format="prose") for task in tasks},
+        ),
+        system_prompt="You are a test agent.",
+        task_instructions={task: "Do it." for task in tasks},
+    )
+
+
+class TestWorkflowValidator:
+    """Tests for WorkflowValidator reference checks."""
+
+    @pytest.fixture
+    def available_agents(self) -> dict:
+        return {
+            "head_writer": _make_agent_definition("head_writer", ["synthesize_beat_sheet"]),
+            "staff_writer_a": _make_agent_definition("staff_writer_a", ["generate_pitches"]),
+        }
+
+    def test_valid_workflow_passes(self, workflow_path: Path, available_agents: dict):
+        """Test that a consistent workflow validates cleanly."""
+        from src.config.workflow_loader import WorkflowLoader
+
+        WorkflowLoader(workflow_path).validate(available_agents)
+
+    def test_unknown_agent_reports_stage(self, workflow_path: Path, available_agents: dict):
+        """Test that an unknown agent names the stage that references it."""
+        from src.config.validation import ConfigurationError as AgentConfigError
+        from src.config.workflow_loader import WorkflowLoader
+
+        del available_agents["head_writer"]
+        with pytest.raises(AgentConfigError) as exc_info:
+            WorkflowLoader(workflow_path).validate(available_agents)
+        assert exc_info.value.message == (
+            "Stage 'story_breaking' references unknown agent: head_writer"
+        )
+
+    def test_unknown_task_reported(self, workflow_path: Path, available_agents: dict):
+        """Test that a missing task on a known agent is reported."""
+        from src.config.validation import ConfigurationError as AgentConfigError
+        from src.config.workflow_loader import WorkflowLoader
+
+        available_agents["staff_writer_a"] = _make_agent_definition(
+            "staff_writer_a", ["table_read_review"]
+        )
+        with pytest.raises(AgentConfigError) as exc_info:
+            WorkflowLoader(workflow_path).validate(available_agents)
+        assert "does not have task 'generate_pitches'" in exc_info.value.message
+        assert "table_read_review" in exc_info.value.suggestion
+
+    def test_validator_shared_across_loaders(self, workflow_path: Path):
+        """Test that loaders for the same file share one validator."""
+        from src.config.workflow_loader import WorkflowLoader
+
+        assert WorkflowLoader(workflow_path).validator is WorkflowLoader(workflow_path).validator
@@ -65,6 +65,13 @@ class TestBuildWorkflowGraph:
         # For now, just verify the graph builds
         assert graph is not None
 
+    def test_graph_built_once(self):
+        """Test that repeated builds share one graph that still compiles."""
+        graph = build_workflow_graph()
+        assert build_workflow_graph() is graph
+        assert compile_app() is not None
+        assert compile_app_no_interrupts() is not None
+
 
 # =============================================================================
 # APP COMPILATION TESTS
@@ -236,6 +243,296 @@ class TestMockedWorkflowExecution:
         assert output.success is True
         assert "Tech Support" in output.content
 
+    @pytest.mark.asyncio
+    async def test_story_editor_overlaps_slow_contributions(self, mock_config, mock_llm):
+        """Test that validation starts before the joke map and research finish."""
+        import asyncio
+
+        from src.workflow import nodes
+
+        record_call = mock_llm.acall
+
+        async def slow_acall(messages, tier, **kwargs):
+            if kwargs["run_name"].endswith((":map_jokes", ":provide_details")):
+                await asyncio.sleep(0.05)
+            return await record_call(messages, tier, **kwargs)
+
+        state = create_initial_state("bible", "prompt")
+        state["showrunner_selected_pitch"] = "Tech Support ER"
+
+        with (
+            patch.object(mock_llm, "acall", side_effect=slow_acall),
+            patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)),
+        ):
+            state = await nodes.story_breaking_node(state)
+
+        completed = [call["run_name"].split(":")[1] for call in mock_llm.call_history]
+        assert completed.index("validate_beat_sheet") < completed.index("map_jokes")
+        assert completed[-1] == "synthesize_beat_sheet"
+        assert state["story_editor_validation"]["content"]
+        assert state["beat_sheet"]
+
+    @pytest.mark.asyncio
+    async def test_agent_fan_out_uses_eager_task_factory(self, mock_config, mock_llm):
+        """Test that node fan-outs start their agent calls through the eager factory."""
+        from src.workflow import nodes
+
+        factory = MagicMock(side_effect=lambda loop, coro: loop.create_task(coro))
+
+        with (
+            patch.object(nodes, "_eager_task_factory", factory),
+            patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)),
+        ):
+            state = await nodes.pitch_session_node(create_initial_state("bible", "prompt"))
+
+        # 4 pitch writers, then research and compile together
+        assert factory.call_count == 6
+        assert len(state["pitches"]) == 4
+        assert state["compiled_pitches"]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_revision_skips_showrunner_review(self, mock_config, mock_llm):
+        """Test that an identical re-integrated draft keeps the previous verdict."""
+        from src.workflow import nodes
+
+        state = create_initial_state("bible", "prompt")
+        state["iteration_count"] = 1
+        state["revised_draft"] = mock_llm.default_response
+        state["showrunner_revision_approved"] = False
+
+        with patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)):
+            state = await nodes.revision_node(state)
+
+        task_types = [call["run_name"].split(":")[1] for call in mock_llm.call_history]
+        assert "coordinate_revision" in task_types
+        assert "review_draft" not in task_types
+        assert state["showrunner_revision_approved"] is False
+        assert state["iteration_count"] == 2
+
+
+# =============================================================================
+# SPECULATIVE CHECKPOINT TESTS
+# =============================================================================
+
+
+async def _run_speculative_workflow(mock_config, mock_llm, beat_answer, on_prompt=None):
+    """
+    Run the interactive workflow with speculation, answering checkpoints automatically.
+
+    Args:
+        mock_config: Test configuration.
+        mock_llm: Mock LLM interface.
+        beat_answer: Updates returned for the beat sheet review, or an
+            exception to raise from its prompt.
+        on_prompt: Optional callback given each checkpoint name while it is
+            being answered.
+
+    Returns:
+        Final state and the patched display_info mock.
+    """
+    import src.run_sketch as run_sketch
+    from src.cli.checkpoints import mock_checkpoint
+    from src.workflow import nodes
+
+    def answer(state, checkpoint_name):
+        if on_prompt is not None:
+            on_prompt(checkpoint_name)
+        if checkpoint_name != "human_beat_review":
+            return mock_checkpoint(state, checkpoint_name)
+        if isinstance(beat_answer, BaseException):
+            raise beat_answer
+        return dict(beat_answer)
+
+    with (
+        patch("src.cli.checkpoints.handle_checkpoint", side_effect=answer),
+        patch("src.utils.llm.get_llm", return_value=mock_llm),
+        patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)),
+        patch.object(run_sketch, "display_info") as display_info,
+    ):
+        state = await run_sketch.run_workflow(mock_config, "spec_test", speculate=True)
+    return state, display_info
+
+
+def _promoted(display_info) -> bool:
+    """Return whether the run announced switching to the speculative thread."""
+    return any(
+        call.args == ("Using the draft prepared during your review",)
+        for call in display_info.call_args_list
+    )
+
+
+class TestStreamUntilInterrupt:
+    """Tests for driving the checkpoint loop from stream interrupt events."""
+
+    @pytest.mark.asyncio
+    async def test_reports_checkpoint_then_end(self, mock_config, mock_llm):
+        """Test True when the graph pauses at an interrupt, False when it reaches END."""
+        from src.run_sketch import _stream_until_interrupt
+        from src.workflow import nodes
+
+        app = compile_app(interrupt_before=["human_pitch_review"])
+        thread_config = {"configurable": {"thread_id": "stream_test"}}
+        initial_state = create_initial_state("bible", "prompt")
+        current_state = dict(initial_state)
+
+        with patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)):
+            paused = await _stream_until_interrupt(app, initial_state, thread_config, current_state)
+            assert paused is True
+            assert (await app.aget_state(thread_config)).next == ("human_pitch_review",)
+            assert current_state["pitches"]
+
+            finished = await _stream_until_interrupt(app, None, thread_config, current_state)
+
+        assert finished is False
+        assert (await app.aget_state(thread_config)).next == ()
+        assert current_state["final_script"]
+
+    @pytest.mark.asyncio
+    async def test_detects_pause_without_interrupt_event(self, mock_config, mock_llm):
+        """Test the pending-node fallback for streams that never emit __interrupt__."""
+        from src.run_sketch import INTERRUPT_EVENT, _stream_until_interrupt
+        from src.workflow import nodes
+
+        app = compile_app(interrupt_before=["human_pitch_review"])
+
+        class NoInterruptEvents:
+            """App whose stream drops interrupt events, as older LangGraph releases did."""
+
+            aget_state = staticmethod(app.aget_state)
+
+            async def astream(self, graph_input, config):
+                async for event in app.astream(graph_input, config):
+                    if INTERRUPT_EVENT not in event:
+                        yield event
+
+        legacy_app = NoInterruptEvents()
+        thread_config = {"configurable": {"thread_id": "legacy_stream_test"}}
+        initial_state = create_initial_state("bible", "prompt")
+        current_state = dict(initial_state)
+
+        with patch.object(nodes, "_get_config_and_llm", return_value=(mock_config, mock_llm)):
+            paused = await _stream_until_interrupt(
+                legacy_app, initial_state, thread_config, current_state
+            )
+            finished = await _stream_until_interrupt(legacy_app, None, thread_config, current_state)
+
+        assert paused is True
+        assert finished is False
+        assert current_state["final_script"]
+
+
+class TestSpeculativeCheckpoints:
+    """Tests for running ahead of the beat sheet review with --speculate."""
+
+    @pytest.mark.asyncio
+    async def test_predicted_answer_promotes_speculative_run(self, mock_config, mock_llm, caplog):
+        """Test that the predicted answer continues on the speculative thread."""
+        import logging
+        import threading
+
+        from src.run_sketch import SPECULATIVE_CHECKPOINTS
+
+        caplog.set_level(logging.INFO)
+        predicted = SPECULATIVE_CHECKPOINTS["human_beat_review"].updates
+        log_levels = {}
+        on_main_thread = set()
+
+        def on_prompt(checkpoint_name):
+            log_levels[checkpoint_name] = logging.getLogger("src.workflow.nodes").isEnabledFor(
+                logging.INFO
+            )
+            on_main_thread.add(threading.current_thread() is threading.main_thread())
+
+        state, display_info = await _run_speculative_workflow(
+            mock_config, mock_llm, predicted, on_prompt
+        )
+
+        assert _promoted(display_info)
+        assert state["human_beat_sheet_notes"] == ""
+        assert state["human_final_approval"] is True
+        # Stage logs are held back only while speculation shares the prompt
+        assert log_levels == {
+            "human_pitch_review": True,
+            "human_beat_review": False,
+            "human_final_review": True,
+        }
+        # Prompts stay on the main thread, where Ctrl-C is delivered
+        assert on_main_thread == {True}
+
+    @pytest.mark.asyncio
+    async def test_different_answer_cancels_speculative_run(self, mock_config, mock_llm):
+        """Test that any other answer cancels speculation and applies the real answer."""
+        import asyncio
+
+        import src.run_sketch as run_sketch
+
+        cancelled = []
+        cleanup_done_by_prompt = {}
+
+        async def pending_speculation(*args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                await asyncio.sleep(0.2)  # slow cleanup
+                cancelled.append(True)
+                raise
+
+        def on_prompt(checkpoint_name):
+            cleanup_done_by_prompt[checkpoint_name] = bool(cancelled)
+
+        answer = {"human_beat_sheet_approval": True, "human_beat_sheet_notes": "Tighten the end"}
+        with patch.object(run_sketch, "_run_speculation", side_effect=pending_speculation):
+            state, display_info = await _run_speculative_workflow(
+                mock_config, mock_llm, answer, on_prompt
+            )
+
+        assert cancelled == [True]
+        # The cancelled run finished cleaning up before the session moved on
+        assert cleanup_done_by_prompt["human_final_review"] is True
+        assert not _promoted(display_info)
+        assert state["human_beat_sheet_notes"] == "Tighten the end"
+        assert state["human_final_approval"] is True
+
+    @pytest.mark.asyncio
+    async def test_interrupted_prompt_cancels_speculative_run(self, mock_config, mock_llm):
+        """Test that Ctrl-C at the prompt cancels the run ahead and waits for it."""
+        import asyncio
+
+        import src.run_sketch as run_sketch
+
+        cancelled = []
+
+        async def pending_speculation(*args):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with (
+            patch.object(run_sketch, "_run_speculation", side_effect=pending_speculation),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            await _run_speculative_workflow(mock_config, mock_llm, KeyboardInterrupt())
+
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_failed_speculation_falls_back(self, mock_config, mock_llm, caplog):
+        """Test that a failed speculative run is logged and the session continues normally."""
+        import src.run_sketch as run_sketch
+
+        predicted = run_sketch.SPECULATIVE_CHECKPOINTS["human_beat_review"].updates
+        failing = AsyncMock(side_effect=RuntimeError("speculation failed"))
+        with patch.object(run_sketch, "_run_speculation", failing):
+            state, display_info = await _run_speculative_workflow(mock_config, mock_llm, predicted)
+
+        failing.assert_awaited_once()
+        assert not _promoted(display_info)
+        assert "Speculative run failed" in caplog.text
+        assert state["human_beat_sheet_approval"] is True
+        assert state["human_final_approval"] is True
+
 
 # =============================================================================
 # FIXTURE STATE TESTS
@@ -254,6 +551,15 @@ class TestFixtureStates:
         assert len(state_after_pitches["pitches"]) > 0
         assert state_after_pitches["compiled_pitches"]
 
+    def test_sync_node_wrapper(self, state_after_pitches):
+        """Test that a sync node wrapper runs the node on the shared loop."""
+        from src.workflow.nodes import human_pitch_review_node_sync
+
+        state = human_pitch_review_node_sync(state_after_pitches)
+
+        assert state["current_stage"] == WorkflowStage.HUMAN_PITCH_REVIEW.value
+        assert state["human_selected_pitches"]
+
     def test_approved_beat_sheet_state(self, state_approved_beat_sheet):
         """Test approved beat sheet state."""
         assert state_approved_beat_sheet["human_beat_sheet_approval"] is True
@@ -337,6 +643,35 @@ class TestComprehensiveWorkflow:
         # All imports successful
         assert True
 
+    def test_config_and_llm_loaded_once(self, mock_config, mock_llm):
+        """Test that nodes share one config and LLM interface per process."""
+        from src.workflow import nodes
+
+        nodes._load_config_and_llm.cache_clear()
+        try:
+            with (
+                patch.object(nodes, "load_config", return_value=mock_config) as load,
+                patch.object(nodes, "get_llm", return_value=mock_llm),
+            ):
+                first = nodes._get_config_and_llm(create_initial_state("b", "p"))
+                second = nodes._get_config_and_llm(create_initial_state("b", "p"))
+        finally:
+            nodes._load_config_and_llm.cache_clear()
+
+        assert first == second == (mock_config, mock_llm)
+        load.assert_called_once()
+
+    def test_agents_shared_across_nodes(self, mock_config, mock_llm):
+        """Test that each agent role is constructed once per config and LLM."""
+        from src.agents import HeadWriterAgent, ShowrunnerAgent
+        from src.workflow.nodes import _agent
+
+        head_writer = _agent(HeadWriterAgent, mock_config, mock_llm)
+
+        assert _agent(HeadWriterAgent, mock_config, mock_llm) is head_writer
+        assert _agent(ShowrunnerAgent, mock_config, mock_llm) is not head_writer
+        assert head_writer.llm is mock_llm
+
     def test_all_agents_can_be_initialized(self, mock_config, mock_llm):
         """Test that all 10 agents can be initialized."""
         from src.agents import (
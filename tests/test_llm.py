@@ -0,0 +1,484 @@
+"""
+Unit tests for the LLM interface utilities.
+
+Tests the src/utils/llm.py and src/utils/llm_cache.py modules including:
+- Response cache key construction and persistence
+- Cache lookups around provider model invocation
+- Client-side concurrency and token-rate limiting
+- Retry policy for provider errors
+- Connection pre-warming
+- LLM interface factory
+- Sync call() wrapper and run_sync()
+- Message construction
+"""
+
+import asyncio
+import dataclasses
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anthropic
+import httpx
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from src.utils.llm import (
+    AnthropicLLM,
+    ModelTier,
+    _build_invoke_config,
+    _is_retryable,
+    _new_event_loop,
+    _wait_for_retry,
+    create_messages,
+    get_llm,
+    run_sync,
+)
+from src.utils.llm_cache import LLMCache
+from src.utils.rate_limit import RateLimiter
+
+
+@pytest.fixture
+def llm_cache(tmp_path: Path) -> LLMCache:
+    """Create a response cache in a temporary directory."""
+    return LLMCache(tmp_path / ".cache" / "llm_responses.sqlite3")
+
+
+@pytest.fixture
+def sample_messages() -> list:
+    """Return a simple system + user message list."""
+    return [SystemMessage(content="You are a writer."), HumanMessage(content="Pitch a sketch.")]
+
+
+class TestLLMCache:
+    """Tests for the SQLite response cache."""
+
+    def test_key_is_deterministic(self, sample_messages):
+        """Test that identical requests produce identical keys."""
+        key_a = LLMCache.make_key("model-x", 0.7, sample_messages)
+        key_b = LLMCache.make_key("model-x", 0.7, list(sample_messages))
+        assert key_a == key_b
+
+    def test_key_varies_with_request(self, sample_messages):
+        """Test that model, temperature and content all affect the key."""
+        base = LLMCache.make_key("model-x", 0.7, sample_messages)
+        assert LLMCache.make_key("model-y", 0.7, sample_messages) != base
+        assert LLMCache.make_key("model-x", 0.3, sample_messages) != base
+        assert LLMCache.make_key("model-x", 0.7, sample_messages[:1]) != base
+
+    def test_round_trip(self, llm_cache: LLMCache):
+        """Test storing and retrieving a response."""
+        assert llm_cache.get("missing") is None
+        llm_cache.set("key", "A sketch about printers.")
+        assert llm_cache.get("key") == "A sketch about printers."
+
+    def test_persists_across_instances(self, llm_cache: LLMCache):
+        """Test that entries survive reopening the database."""
+        llm_cache.set("key", [{"type": "text", "text": "block"}])
+        reopened = LLMCache(llm_cache.path)
+        assert reopened.get("key") == [{"type": "text", "text": "block"}]
+
+    def test_clear(self, llm_cache: LLMCache):
+        """Test that clear removes all entries."""
+        llm_cache.set("key", "value")
+        llm_cache.clear()
+        assert llm_cache.get("key") is None
+
+
+class TestInvokeModelCaching:
+    """Tests for cache use around provider model calls."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(
+        self, mock_llm_config, llm_cache: LLMCache, sample_messages
+    ):
+        """Test that a repeated request skips the provider and costs no tokens."""
+        llm = AnthropicLLM(mock_llm_config, cache=llm_cache)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content="Fresh response",
+                usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+            )
+        )
+        llm.get_model = MagicMock(return_value=model)
+
+        first = await llm.acall(sample_messages, ModelTier.CREATIVE)
+        second = await llm.acall(sample_messages, ModelTier.CREATIVE)
+
+        assert first.content == second.content == "Fresh response"
+        assert model.ainvoke.await_count == 1
+        assert second.total_tokens == 0
+        assert llm.usage.total_tokens == 15
+        assert (llm.usage.cache_hits, llm.usage.cache_misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_not_counted_as_call(
+        self, mock_llm_config, llm_cache: LLMCache, sample_messages
+    ):
+        """Test that a cache hit counts as a hit, not as a provider call."""
+        llm = AnthropicLLM(mock_llm_config, cache=llm_cache)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="Fresh response"))
+        llm.get_model = MagicMock(return_value=model)
+
+        await llm.acall(sample_messages, ModelTier.CREATIVE)
+        calls_after_miss = llm.usage.call_count
+        await llm.acall(sample_messages, ModelTier.CREATIVE)
+
+        assert calls_after_miss == 1
+        assert llm.usage.call_count == calls_after_miss
+        assert llm.usage.cache_hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_io_runs_off_event_loop(
+        self, mock_llm_config, llm_cache: LLMCache, sample_messages
+    ):
+        """Test that cache reads and writes run on worker threads, not the loop thread."""
+        llm = AnthropicLLM(mock_llm_config, cache=llm_cache)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="Fresh response"))
+        llm.get_model = MagicMock(return_value=model)
+
+        io_threads = []
+        get, set_ = llm_cache.get, llm_cache.set
+
+        def record_get(key):
+            io_threads.append(threading.get_ident())
+            return get(key)
+
+        def record_set(key, content):
+            io_threads.append(threading.get_ident())
+            set_(key, content)
+
+        with (
+            patch.object(llm_cache, "get", side_effect=record_get),
+            patch.object(llm_cache, "set", side_effect=record_set),
+        ):
+            await llm.acall(sample_messages, ModelTier.CREATIVE)
+
+        assert len(io_threads) == 2
+        assert threading.get_ident() not in io_threads
+
+    @pytest.mark.asyncio
+    async def test_no_cache_always_calls_provider(self, mock_llm_config, sample_messages):
+        """Test that without a cache every request reaches the provider."""
+        llm = AnthropicLLM(mock_llm_config)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="Fresh response"))
+        llm.get_model = MagicMock(return_value=model)
+
+        await llm.acall(sample_messages, ModelTier.CREATIVE)
+        await llm.acall(sample_messages, ModelTier.CREATIVE)
+
+        assert model.ainvoke.await_count == 2
+
+
+class TestRateLimiter:
+    """Tests for client-side rate limiting of provider calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_capped(self):
+        """Test that no more than max_concurrency requests run at once."""
+        limiter = RateLimiter(max_concurrency=2)
+        in_flight = peak = 0
+
+        async def request():
+            nonlocal in_flight, peak
+            async with limiter.limit():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(5)))
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_waits_for_refill(self):
+        """Test that a drained bucket delays the next request until it refills."""
+        limiter = RateLimiter(max_concurrency=4, tokens_per_minute=6000)
+        loop = asyncio.get_running_loop()
+
+        async with limiter.limit(6000):
+            pass
+        start = loop.time()
+        async with limiter.limit(10):
+            pass
+
+        assert loop.time() - start >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_provider_calls_admitted_through_limiter(self, mock_llm_config, sample_messages):
+        """Test that concurrent acall()s respect the configured concurrency cap."""
+        llm = AnthropicLLM(dataclasses.replace(mock_llm_config, max_concurrency=1))
+        in_flight = peak = 0
+
+        async def ainvoke(messages, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return AIMessage(content="Fresh response")
+
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = ainvoke
+        llm.get_model = MagicMock(return_value=model)
+
+        await asyncio.gather(*(llm.acall(sample_messages) for _ in range(3)))
+
+        assert peak == 1
+
+
+class TestPromptCacheUsage:
+    """Tests for prompt-cache token accounting."""
+
+    @pytest.mark.asyncio
+    async def test_cache_token_details_tracked(self, mock_llm_config, sample_messages):
+        """Test that prompt-cache reads and writes are added to usage."""
+        llm = AnthropicLLM(mock_llm_config)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(
+            return_value=AIMessage(
+                content="Response",
+                usage_metadata={
+                    "input_tokens": 1200,
+                    "output_tokens": 50,
+                    "total_tokens": 1250,
+                    "input_token_details": {"cache_read": 1000, "cache_creation": 150},
+                },
+            )
+        )
+        llm.get_model = MagicMock(return_value=model)
+
+        await llm.acall(sample_messages, ModelTier.CREATIVE)
+
+        assert llm.usage.cache_read_tokens == 1000
+        assert llm.usage.cache_creation_tokens == 150
+        assert llm.usage.prompt_tokens == 1200
+
+
+class TestInvokeConfig:
+    """Tests for the tracing config passed to provider calls."""
+
+    def test_empty_without_tracing_arguments(self):
+        """Test that untraced calls get no config at all."""
+        assert _build_invoke_config(ModelTier.SUPPORT, "support-model", None, None, None) == {}
+
+    def test_model_info_added_without_mutating_metadata(self):
+        """Test that model info is merged into a copy of the caller's metadata."""
+        metadata = {"agent_name": "QA"}
+        config = _build_invoke_config(
+            ModelTier.CREATIVE, "creative-model", "qa:review", ["agent:qa"], metadata
+        )
+
+        assert config == {
+            "run_name": "qa:review",
+            "tags": ["agent:qa"],
+            "metadata": {
+                "agent_name": "QA",
+                "model_tier": "creative",
+                "model_name": "creative-model",
+            },
+        }
+        assert metadata == {"agent_name": "QA"}
+
+
+class TestRetryPolicy:
+    """Tests for which provider errors are retried and how long to wait."""
+
+    @staticmethod
+    def _status_error(status_code: int, headers: dict | None = None):
+        request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+        response = httpx.Response(status_code, headers=headers, request=request)
+        return anthropic.APIStatusError("error", response=response, body=None)
+
+    def test_transient_errors_retried(self):
+        """Test that rate limits, server errors and dropped connections retry."""
+        assert _is_retryable(self._status_error(429))
+        assert _is_retryable(self._status_error(529))
+        assert _is_retryable(httpx.ConnectError("connection refused"))
+
+    def test_permanent_errors_not_retried(self):
+        """Test that bad requests and programming errors fail immediately."""
+        assert not _is_retryable(self._status_error(400))
+        assert not _is_retryable(self._status_error(401))
+        assert not _is_retryable(KeyError("content"))
+
+    def test_retry_after_header_honored(self):
+        """Test that the provider's Retry-After header sets the wait."""
+        retry_state = MagicMock()
+        retry_state.outcome.exception.return_value = self._status_error(
+            429, headers={"retry-after": "7"}
+        )
+        assert _wait_for_retry(retry_state) == 7.0
+
+    @pytest.mark.asyncio
+    async def test_programming_error_raised_without_retry(self, mock_llm_config, sample_messages):
+        """Test that a non-transient error reaches the caller after one attempt."""
+        llm = AnthropicLLM(mock_llm_config)
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = AsyncMock(side_effect=ValueError("bad payload"))
+        llm.get_model = MagicMock(return_value=model)
+
+        with pytest.raises(ValueError, match="bad payload"):
+            await llm.acall(sample_messages, ModelTier.CREATIVE)
+        assert model.ainvoke.await_count == 1
+
+
+class TestPrewarm:
+    """Tests for connection pre-warming."""
+
+    @pytest.mark.asyncio
+    async def test_opens_requested_connections(self, mock_llm_config):
+        """Test that prewarm issues one ping per requested connection."""
+        llm = AnthropicLLM(mock_llm_config)
+        llm._ping = AsyncMock()
+
+        await llm.prewarm(connections=3)
+
+        assert llm._ping.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_ignored(self, mock_llm_config):
+        """Test that an unreachable provider does not fail the workflow."""
+        llm = AnthropicLLM(mock_llm_config)
+        llm._ping = AsyncMock(side_effect=httpx.ConnectError("offline"))
+
+        await llm.prewarm()
+
+    @pytest.mark.asyncio
+    async def test_broken_ping_logged_as_warning(self, mock_llm_config, caplog):
+        """Test that a pre-warm broken by a client change is visible, not silent."""
+        llm = AnthropicLLM(mock_llm_config)
+        llm._creative_model = MagicMock(spec=[])  # no _async_client attribute
+
+        await llm.prewarm(connections=1)
+
+        assert any(
+            r.levelname == "WARNING" and "pre-warm failed" in r.getMessage() for r in caplog.records
+        )
+
+
+class TestGetLLM:
+    """Tests for the get_llm factory."""
+
+    def test_reuses_interface_for_same_config(self, mock_config):
+        """Test that nodes asking for the same config share one interface."""
+        first = get_llm(mock_config)
+        assert get_llm(mock_config) is first
+        assert isinstance(first, AnthropicLLM)
+
+    def test_unsupported_provider(self, mock_config):
+        """Test that an unknown provider raises ValueError."""
+        config = dataclasses.replace(
+            mock_config, llm=dataclasses.replace(mock_config.llm, provider="llamacorp")
+        )
+        with pytest.raises(ValueError, match="Unsupported LLM provider"):
+            get_llm(config)
+
+
+class TestSyncCall:
+    """Tests for the sync call() wrapper."""
+
+    def test_calls_share_one_event_loop(self, mock_llm_config, sample_messages):
+        """Test that sync calls reuse a persistent loop instead of a new one each."""
+        llm = AnthropicLLM(mock_llm_config)
+        loops = []
+
+        async def fake_ainvoke(messages, **kwargs):
+            loops.append(asyncio.get_running_loop())
+            return AIMessage(content="Sync response")
+
+        model = MagicMock(temperature=0.7)
+        model.ainvoke = fake_ainvoke
+        llm.get_model = MagicMock(return_value=model)
+
+        first = llm.call(sample_messages, ModelTier.SUPPORT)
+        second = llm.call(sample_messages, ModelTier.SUPPORT)
+
+        assert first.content == second.content == "Sync response"
+        assert loops[0] is loops[1]
+        assert loops[0].is_running()
+
+    @pytest.mark.asyncio
+    async def test_call_from_running_loop(self, mock_llm_config, sample_messages):
+        """Test that call() works from code already inside an event loop."""
+        llm = AnthropicLLM(mock_llm_config)
+        model = MagicMock(temperature=0.3)
+        model.ainvoke = AsyncMock(return_value=AIMessage(content="Sync response"))
+        llm.get_model = MagicMock(return_value=model)
+
+        response = llm.call(sample_messages, ModelTier.SUPPORT)
+
+        assert response.content == "Sync response"
+
+    def test_sync_loop_uses_uvloop_when_installed(self, monkeypatch):
+        """Test that the sync loop is built by uvloop if it can be imported."""
+        loop = asyncio.new_event_loop()
+        monkeypatch.setitem(sys.modules, "uvloop", MagicMock(new_event_loop=lambda: loop))
+        try:
+            assert _new_event_loop() is loop
+        finally:
+            loop.close()
+
+    def test_run_sync_from_loop_thread_raises(self):
+        """Test that blocking the sync loop from itself fails instead of deadlocking."""
+
+        async def nested():
+            return run_sync(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError, match="Cannot block"):
+            run_sync(nested())
+
+
+class TestCreateMessages:
+    """Tests for message list construction."""
+
+    def test_system_message_reused_per_prompt(self):
+        """Test that calls with the same system prompt share one SystemMessage."""
+        first = create_messages("You are the QA agent.", "Review draft one.")
+        second = create_messages("You are the QA agent.", "Review draft two.")
+
+        assert first[0] is second[0]
+        assert first[1].content != second[1].content
+
+
+class TestPromptCacheBreakpoints:
+    """Tests for Anthropic prompt-cache breakpoint marking."""
+
+    def test_marks_system_and_shared_context(self):
+        """Test that the system prompt and shared context block get breakpoints."""
+        from src.utils.llm import EPHEMERAL_CACHE_CONTROL, _with_cache_breakpoints, create_messages
+
+        messages = create_messages("System", "Task", shared_context="Bible")
+        marked = _with_cache_breakpoints(messages)
+
+        assert marked[0].content[0]["cache_control"] == EPHEMERAL_CACHE_CONTROL
+        shared_block, task_block = marked[1].content
+        assert shared_block == {
+            "type": "text",
+            "text": "Bible",
+            "cache_control": EPHEMERAL_CACHE_CONTROL,
+        }
+        assert "cache_control" not in task_block
+
+    def test_does_not_modify_inputs(self):
+        """Test that the original messages are left untouched."""
+        from src.utils.llm import _with_cache_breakpoints, create_messages
+
+        messages = create_messages("System", "Task", shared_context="Bible")
+        _with_cache_breakpoints(messages)
+
+        assert messages[0].content == "System"
+        assert "cache_control" not in messages[1].content[0]
+
+    def test_plain_user_message_unchanged(self):
+        """Test that string user content gets no user-side breakpoint."""
+        from src.utils.llm import _with_cache_breakpoints, create_messages
+
+        marked = _with_cache_breakpoints(create_messages("System", "Task"))
+        assert marked[1].content == "Task"
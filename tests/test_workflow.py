@@ -402,6 +402,12 @@ class TestUpdateStage:
         assert state["current_stage"] == "showrunner_select"
         assert len(state["stage_history"]) == 4  # init + 3 updates
 
+    def test_update_stage_does_not_mutate_input(self):
+        """Test that earlier states keep their own history."""
+        state = create_initial_state("bible", "prompt")
+        update_stage(state, WorkflowStage.PITCH_SESSION)
+        assert len(state["stage_history"]) == 1
+
 
 # =============================================================================
 # ADD ERROR TESTS
@@ -455,6 +461,12 @@ class TestAddError:
         assert state["error_log"][0]["error"] == "First error"
         assert state["error_log"][1]["error"] == "Second error"
 
+    def test_add_error_does_not_mutate_input(self):
+        """Test that earlier states keep their own error log."""
+        state = create_initial_state("bible", "prompt")
+        add_error(state, "Some error")
+        assert state["error_log"] == []
+
 
 # =============================================================================
 # UPDATE TOKEN USAGE TESTS